@@ -185,3 +185,56 @@ async def test_api_cancel_listeners(connected_zboss, mocker):
     # we do not remove indication listeners
     # because
     assert len(zboss._listeners) == 0
+
+
+@pytest.mark.asyncio
+async def test_api_listener_counts(connected_zboss, mocker):
+    """Test listener counts are kept up to date without recounting."""
+    zboss, zboss_server = connected_zboss
+
+    callback_listener = zboss.register_indication_listener(
+        c.NcpConfig.GetZigbeeRole.Rsp(partial=True), mocker.Mock()
+    )
+    future, one_shot_listener = zboss.wait_for_responses(
+        [
+            c.NcpConfig.GetZigbeeRole.Rsp(partial=True),
+            c.NcpConfig.GetModuleVersion.Rsp(partial=True),
+        ],
+        context=True,
+    )
+
+    assert zboss._listener_counts[IndicationListener] == 1
+    assert zboss._listener_counts[OneShotResponseListener] == 1
+
+    # Removing a listener twice only counts once
+    zboss.remove_listener(one_shot_listener)
+    zboss.remove_listener(one_shot_listener)
+
+    assert zboss._listener_counts[IndicationListener] == 1
+    assert zboss._listener_counts[OneShotResponseListener] == 0
+
+    zboss.remove_listener(callback_listener)
+
+    assert zboss._listener_counts[IndicationListener] == 0
+    future.cancel()
+
+
+@pytest.mark.asyncio
+async def test_api_listener_order(connected_zboss, mocker):
+    """Test indication listeners are dispatched before one-shot listeners."""
+    zboss, zboss_server = connected_zboss
+
+    response = c.NcpConfig.GetZigbeeRole.Rsp(partial=True)
+
+    future1, one_shot1 = zboss.wait_for_responses([response], context=True)
+    future2, one_shot2 = zboss.wait_for_responses([response], context=True)
+    callback_listener = zboss.register_indication_listener(
+        response, mocker.Mock()
+    )
+
+    assert zboss._listeners[response.header] == [
+        callback_listener, one_shot1, one_shot2
+    ]
+
+    future1.cancel()
+    future2.cancel()
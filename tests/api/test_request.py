@@ -191,4 +191,26 @@ async def test_frame_merge(connected_zboss, mocker):
     assert zboss.frame_received(fragments[-1])
 
     # Check the state of _rx_fragments after merging
-    assert zboss._rx_fragments == []
+    assert not zboss._rx_fragments
+
+
+@pytest.mark.asyncio
+async def test_zboss_version(connected_zboss):
+    """Test the NCP module versions are split into their byte fields."""
+    zboss, zboss_server = connected_zboss
+
+    zboss_server.reply_once_to(
+        c.NcpConfig.GetModuleVersion.Req(partial=True),
+        responses=[
+            c.NcpConfig.GetModuleVersion.Rsp(
+                TSN=0,
+                StatusCat=t.StatusCategory(1),
+                StatusCode=t.StatusCodeGeneric.OK,
+                FWVersion=0x01020304,
+                StackVersion=0x0A0B0C0D,
+                ProtocolVersion=0xFF000001,
+            )
+        ],
+    )
+
+    assert await zboss.version() == ("1.2.3.4", "10.11.12.13", "255.0.0.1")
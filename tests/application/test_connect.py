@@ -69,7 +69,7 @@ async def test_probe_unsuccessful_slow(make_zboss_server, mocker):
     )
 
     # Don't respond to anything
-    zboss_server._listeners.clear()
+    zboss_server.clear_listeners()
 
     mocker.patch("zigpy_zboss.zigbee.application.PROBE_TIMEOUT", new=0.1)
 
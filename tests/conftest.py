@@ -5,7 +5,8 @@ import inspect
 import logging
 import sys
 import typing
-from unittest.mock import AsyncMock, MagicMock, Mock, PropertyMock, patch
+from collections import Counter
+from unittest.mock import AsyncMock, MagicMock, Mock, PropertyMock
 
 import pytest
 import zigpy
@@ -23,16 +24,15 @@ LOGGER = logging.getLogger(__name__)
 FAKE_SERIAL_PORT = "/dev/ttyFAKE0"
 
 
-# Globally handle async tests and error on unawaited coroutines
-def pytest_collection_modifyitems(session, config, items):
-    """Modify collection items."""
-    for item in items:
-        item.add_marker(
-            pytest.mark.filterwarnings(
-                "error::pytest.PytestUnraisableExceptionWarning"
-            )
-        )
-        item.add_marker(pytest.mark.filterwarnings("error::RuntimeWarning"))
+def pytest_addoption(parser) -> None:
+    """Register custom command line options."""
+    parser.addoption(
+        "--strict-resource-warnings",
+        action="store_true",
+        default=False,
+        help="Run the garbage collector after every test to surface "
+             "ResourceWarnings in the test that caused them.",
+    )
 
 
 @pytest.hookimpl(trylast=True)
@@ -67,11 +67,13 @@ def event_loop(
 ) -> typing.Iterator[asyncio.AbstractEventLoop]:
     """Create an instance of the default event loop for each test case."""
     yield asyncio.get_event_loop_policy().new_event_loop()
-    # Call the garbage collector to trigger ResourceWarning's as soon
-    # as possible (these are triggered in various __del__ methods).
+    # Optionally call the garbage collector to trigger ResourceWarning's as
+    # soon as possible (these are triggered in various __del__ methods).
     # Without this, resources opened in one test can fail other tests
-    # when the warning is generated.
-    gc.collect()
+    # when the warning is generated. A full collection after every test is
+    # expensive, so it is only done when explicitly requested.
+    if request.config.getoption("--strict-resource-warnings"):
+        gc.collect()
     # Event loop cleanup handled by pytest_fixture_post_finalizer
 
 
@@ -160,7 +162,7 @@ def make_zboss_server(mocker):
         server.port_path = FAKE_SERIAL_PORT
         server._uart = None
 
-        def passthrough_serial_conn(
+        async def passthrough_serial_conn(
                 loop, protocol_factory, url, *args, **kwargs
         ):
             LOGGER.info("Intercepting serial connection to %s", url)
@@ -195,10 +197,7 @@ def make_zboss_server(mocker):
             server_transport._connect()
             client_transport._connect()
 
-            fut = loop.create_future()
-            fut.set_result((client_transport, client_protocol))
-
-            return fut
+            return client_transport, client_protocol
 
         mocker.patch(
             "zigpy.serial.pyserial_asyncio.create_serial_connection",
@@ -246,6 +245,29 @@ def connected_zboss(event_loop, make_connected_zboss):
     zboss.close()
 
 
+@pytest.fixture(scope="session")
+def all_commands_index():
+    """Index every command class by its header, once per session.
+
+    Returns the `{header: command}` mapping and any `(first, duplicate)`
+    pairs of commands sharing a header.
+    """
+    commands_by_id = {}
+    duplicates = []
+
+    for commands in c.ALL_COMMANDS:
+        for cmd in commands:
+            for command in (cmd.Req, cmd.Rsp, cmd.Ind):
+                if command is None:
+                    continue
+
+                first = commands_by_id.setdefault(command.header, command)
+                if first is not command:
+                    duplicates.append((first, command))
+
+    return commands_by_id, duplicates
+
+
 def reply_to(request):
     """Reply to decorator."""
     def inner(function):
@@ -259,6 +281,19 @@ def reply_to(request):
     return inner
 
 
+def with_tsn(command, tsn):
+    """Return a copy of a prebuilt response with a different TSN.
+
+    Commands are immutable, so the copy is built from the template's
+    parameters with only the TSN replaced.
+    """
+    params = {param.name: getattr(command, param.name)
+              for param in command.schema}
+    params["TSN"] = tsn
+
+    return type(command)(**params)
+
+
 def serialize_zdo_command(command_id, **kwargs):
     """ZDO command serialization."""
     field_names, field_types = zdo_t.CLUSTERS[command_id]
@@ -279,6 +314,8 @@ class BaseServerZBOSS(ZBOSS):
 
     align_structs = False
     version = None
+    # Seconds to wait before each response, only yields to the loop by default
+    response_delay = 0
 
     async def _flatten_responses(self, request, responses):
         if responses is None:
@@ -303,16 +340,27 @@ class BaseServerZBOSS(ZBOSS):
 
     async def _send_responses(self, request, responses):
         async for response in self._flatten_responses(request, responses):
-            await asyncio.sleep(0.001)
+            await asyncio.sleep(self.response_delay)
             LOGGER.debug(
                 "Replying to %s with %s", request, response
             )
             await self.send(response)
 
+    def clear_listeners(self):
+        """Drop every listener without cancelling it, so nothing replies."""
+        self._listeners.clear()
+        self._listener_counts.clear()
+
+    def _remove_listeners(self, header):
+        """Cancel and remove every listener bound to a header."""
+        for listener in list(self._listeners.get(header, [])):
+            listener.cancel()
+            self.remove_listener(listener)
+
     def reply_once_to(self, request, responses, *, override=False):
         """Reply once to."""
         if override:
-            self._listeners[request.header].clear()
+            self._remove_listeners(request.header)
 
         request_future = self.wait_for_response(request)
 
@@ -327,7 +375,7 @@ class BaseServerZBOSS(ZBOSS):
     def reply_to(self, request, responses, *, override=False):
         """Reply to."""
         if override:
-            self._listeners[request.header].clear()
+            self._remove_listeners(request.header)
 
         async def callback(request):
             callback.call_count += 1
@@ -341,6 +389,31 @@ class BaseServerZBOSS(ZBOSS):
 
         return callback
 
+    @classmethod
+    def _get_reply_to_table(cls):
+        """Return the `(request, name)` pairs of `reply_to` handlers.
+
+        The table is computed once per class by walking the class namespaces
+        directly, so no descriptors are invoked.
+        """
+        if "_reply_to_table" in cls.__dict__:
+            return cls._reply_to_table
+
+        handlers = {}
+
+        for klass in cls.__mro__:
+            for name, func in vars(klass).items():
+                # The most derived definition wins, like with `getattr`
+                handlers.setdefault(name, func)
+
+        cls._reply_to_table = [
+            (req, name)
+            for name, func in sorted(handlers.items())
+            for req in getattr(func, "_reply_to", [])
+        ]
+
+        return cls._reply_to_table
+
     async def send(self, response):
         """Send."""
         if response is not None and self._uart is not None:
@@ -349,8 +422,16 @@ class BaseServerZBOSS(ZBOSS):
     def close(self):
         """Close."""
         # We don't clear listeners on shutdown
-        with patch.object(self, "_listeners", {}):
+        listeners = self._listeners
+        listener_counts = self._listener_counts
+        self._listeners = {}
+        self._listener_counts = Counter()
+
+        try:
             return super().close()
+        finally:
+            self._listeners = listeners
+            self._listener_counts = listener_counts
 
 
 def simple_deepcopy(d):
@@ -493,9 +574,210 @@ def zdo_request_matcher(
     )
 
 
+NVRAM_IEEE_1 = t.EUI64.convert("00:11:22:33:44:55:66:77")
+NVRAM_IEEE_2 = t.EUI64.convert("00:11:22:33:44:55:66:78")
+
+# The NVRAM datasets served by the fake devices never change, serialize once
+NVRAM_COMMON_DATA = t.NVRAMDataset(
+    t.DSCommonData(
+        byte_count=100,
+        bitfield=1,
+        depth=1,
+        nwk_manager_addr=0x0000,
+        panid=0x1234,
+        network_addr=0x5678,
+        channel_mask=t.Channels(14),
+        aps_extended_panid=NVRAM_IEEE_1,
+        nwk_extended_panid=NVRAM_IEEE_1,
+        parent_addr=NVRAM_IEEE_1,
+        tc_addr=NVRAM_IEEE_1,
+        nwk_key=t.KeyData(b'\x01' * 16),
+        nwk_key_seq=0,
+        tc_standard_key=t.KeyData(b'\x02' * 16),
+        channel=15,
+        page=0,
+        mac_interface_table=t.MacInterfaceTable(
+            bitfield_0=0,
+            bitfield_1=1,
+            link_pwr_data_rate=250,
+            channel_in_use=11,
+            supported_channels=t.Channels(15)
+        ),
+        reserved=0
+    ).serialize()
+)
+
+NVRAM_IB_COUNTERS = t.NVRAMDataset(
+    t.DSIbCounters(
+        byte_count=8,
+        nib_counter=100,  # Example counter value
+        aib_counter=50  # Example counter value
+    ).serialize()
+)
+
+# The address map header is computed from the records when serializing
+NVRAM_ADDR_MAP = t.NVRAMDataset(
+    t.DSNwkAddrMap([
+        t.NwkAddrMapRecord(
+            ieee_addr=NVRAM_IEEE_1,
+            nwk_addr=0x1234,
+            index=1,
+            redirect_type=0,
+            redirect_ref=0,
+            _align=0
+        ),
+        t.NwkAddrMapRecord(
+            ieee_addr=NVRAM_IEEE_2,
+            nwk_addr=0x5678,
+            index=2,
+            redirect_type=0,
+            redirect_ref=0,
+            _align=0
+        )
+    ]).serialize()
+)
+
+NVRAM_APS_SECURE_DATA = t.NVRAMDataset(
+    t.DSApsSecureKeys([
+        t.ApsSecureEntry(
+            ieee_addr=NVRAM_IEEE_1,
+            key=t.KeyData(b'\x03' * 16),
+            _unknown_1=0
+        ),
+        t.ApsSecureEntry(
+            ieee_addr=NVRAM_IEEE_2,
+            key=t.KeyData(b'\x04' * 16),
+            _unknown_1=0
+        )
+    ]).serialize()
+)
+
+NVRAM_EMPTY = t.NVRAMDataset(b'')
+
+# DatasetId -> (dataset, NVRAM version, dataset version)
+NVRAM_TABLE = {
+    t.DatasetId.ZB_NVRAM_COMMON_DATA: (NVRAM_COMMON_DATA, 3, 1),
+    t.DatasetId.ZB_IB_COUNTERS: (NVRAM_IB_COUNTERS, 1, 1),
+    t.DatasetId.ZB_NVRAM_ADDR_MAP: (NVRAM_ADDR_MAP, 2, 1),
+    t.DatasetId.ZB_NVRAM_APS_SECURE_DATA: (NVRAM_APS_SECURE_DATA, 1, 1),
+}
+
+
 class BaseZbossDevice(BaseServerZBOSS):
     """Base ZBOSS Device."""
 
+    # Responses whose only per-request field is the TSN are built once
+    _TEMPLATES = {
+        "get_join_status": c.NcpConfig.GetJoinStatus.Rsp(
+            TSN=0,
+            StatusCat=t.StatusCategory(1),
+            StatusCode=t.StatusCodeGeneric.OK,
+            Joined=0x01  # Assume device is joined for this example
+        ),
+        "get_ncp_reset": c.NcpConfig.NCPModuleReset.Rsp(
+            TSN=0xFF,
+            StatusCat=t.StatusCategory(1),
+            StatusCode=t.StatusCodeGeneric.OK
+        ),
+        "get_short_addr": c.NcpConfig.GetShortAddr.Rsp(
+            TSN=0,
+            StatusCat=t.StatusCategory(1),
+            StatusCode=t.StatusCodeGeneric.OK,
+            NWKAddr=t.NWK(0x1234)  # Example NWK address
+        ),
+        "get_zigbee_role": c.NcpConfig.GetZigbeeRole.Rsp(
+            TSN=0,
+            StatusCat=t.StatusCategory(1),
+            StatusCode=t.StatusCodeGeneric.OK,
+            DeviceRole=t.DeviceRole(1)  # Example role
+        ),
+        "get_extended_panid": c.NcpConfig.GetExtendedPANID.Rsp(
+            TSN=0,
+            StatusCat=t.StatusCategory(1),
+            StatusCode=t.StatusCodeGeneric.OK,
+            ExtendedPANID=t.EUI64.convert("00124b0001ab89cd")  # Example PAN ID
+        ),
+        "get_permit_join": c.ZDO.PermitJoin.Rsp(
+            TSN=0,
+            StatusCat=t.StatusCategory(1),
+            StatusCode=t.StatusCodeGeneric.OK,
+        ),
+        "get_short_panid": c.NcpConfig.GetShortPANID.Rsp(
+            TSN=0,
+            StatusCat=t.StatusCategory(1),
+            StatusCode=t.StatusCodeGeneric.OK,
+            PANID=t.PanId(0x5678)  # Example short PAN ID
+        ),
+        "get_channel_mask": c.NcpConfig.GetChannelMask.Rsp(
+            TSN=0,
+            StatusCat=t.StatusCategory(1),
+            StatusCode=t.StatusCodeGeneric.OK,
+            ChannelList=t.ChannelEntryList(
+                [t.ChannelEntry(page=1, channel_mask=0x07fff800)])
+        ),
+        "get_trust_center_addr": c.NcpConfig.GetTrustCenterAddr.Rsp(
+            TSN=0,
+            StatusCat=t.StatusCategory(1),
+            StatusCode=t.StatusCodeGeneric.OK,
+            TCIEEE=t.EUI64.convert("00:11:22:33:44:55:66:77")
+            # Example Trust Center IEEE address
+        ),
+        "get_rx_on_when_idle": c.NcpConfig.GetRxOnWhenIdle.Rsp(
+            TSN=0,
+            StatusCat=t.StatusCategory(1),
+            StatusCode=t.StatusCodeGeneric.OK,
+            RxOnWhenIdle=1  # Example RxOnWhenIdle value
+        ),
+        "start_without_formation": c.NWK.StartWithoutFormation.Rsp(
+            TSN=0,
+            StatusCat=t.StatusCategory(1),
+            StatusCode=t.StatusCodeGeneric.OK  # Example status code
+        ),
+        "get_module_version": c.NcpConfig.GetModuleVersion.Rsp(
+            TSN=0,
+            StatusCat=t.StatusCategory(1),
+            StatusCode=t.StatusCodeGeneric.OK,  # Example status code
+            FWVersion=1,  # Example firmware version
+            StackVersion=2,  # Example stack version
+            ProtocolVersion=3  # Example protocol version
+        ),
+        "set_simple_desc": c.AF.SetSimpleDesc.Rsp(
+            TSN=0,
+            StatusCat=t.StatusCategory(1),
+            StatusCode=t.StatusCodeGeneric.OK  # Example status code
+        ),
+        "get_ed_timeout": c.NcpConfig.GetEDTimeout.Rsp(
+            TSN=0,
+            StatusCat=t.StatusCategory(1),
+            StatusCode=t.StatusCodeGeneric.OK,
+            Timeout=t.TimeoutIndex(0x01)  # Example timeout value
+        ),
+        "get_max_children": c.NcpConfig.GetMaxChildren.Rsp(
+            TSN=0,
+            StatusCat=t.StatusCategory(1),
+            StatusCode=t.StatusCodeGeneric.OK,
+            ChildrenNbr=5  # Example max children
+        ),
+        "get_authentication_status": c.NcpConfig.GetAuthenticationStatus.Rsp(
+            TSN=0,
+            StatusCat=t.StatusCategory(1),
+            StatusCode=t.StatusCodeGeneric.OK,
+            Authenticated=1  # Example authenticated value
+        ),
+        "get_parent_addr": c.NcpConfig.GetParentAddr.Rsp(
+            TSN=0,
+            StatusCat=t.StatusCategory(1),
+            StatusCode=t.StatusCodeGeneric.OK,
+            NWKParentAddr=t.NWK(0x1234)  # Example parent NWK address
+        ),
+        "get_coordinator_version": c.NcpConfig.GetCoordinatorVersion.Rsp(
+            TSN=0,
+            StatusCat=t.StatusCategory(1),
+            StatusCode=t.StatusCodeGeneric.OK,
+            CoordinatorVersion=1  # Example coordinator version
+        ),
+    }
+
     def __init__(self, *args, **kwargs):
         """Initialize."""
         super().__init__(*args, **kwargs)
@@ -505,10 +787,8 @@ class BaseZbossDevice(BaseServerZBOSS):
         self.new_channel = 0
         self.device_state = 0x00
         self.zdo_callbacks = set()
-        for name in dir(self):
-            func = getattr(self, name)
-            for req in getattr(func, "_reply_to", []):
-                self.reply_to(request=req, responses=[func])
+        for req, name in type(self)._get_reply_to_table():
+            self.reply_to(request=req, responses=[getattr(self, name)])
 
     def connection_lost(self, exc):
         """Lost connection."""
@@ -518,31 +798,17 @@ class BaseZbossDevice(BaseServerZBOSS):
     @reply_to(c.NcpConfig.GetJoinStatus.Req(partial=True))
     def get_join_status(self, request):
         """Handle get join status."""
-        return c.NcpConfig.GetJoinStatus.Rsp(
-            TSN=request.TSN,
-            StatusCat=t.StatusCategory(1),
-            StatusCode=t.StatusCodeGeneric.OK,
-            Joined=0x01  # Assume device is joined for this example
-        )
+        return with_tsn(self._TEMPLATES["get_join_status"], request.TSN)
 
     @reply_to(c.NcpConfig.NCPModuleReset.Req(partial=True))
     def get_ncp_reset(self, request):
         """Handle NCP reset."""
-        return c.NcpConfig.NCPModuleReset.Rsp(
-            TSN=0xFF,
-            StatusCat=t.StatusCategory(1),
-            StatusCode=t.StatusCodeGeneric.OK
-        )
+        return self._TEMPLATES["get_ncp_reset"]
 
     @reply_to(c.NcpConfig.GetShortAddr.Req(partial=True))
     def get_short_addr(self, request):
         """Handle get short address."""
-        return c.NcpConfig.GetShortAddr.Rsp(
-            TSN=request.TSN,
-            StatusCat=t.StatusCategory(1),
-            StatusCode=t.StatusCodeGeneric.OK,
-            NWKAddr=t.NWK(0x1234)  # Example NWK address
-        )
+        return with_tsn(self._TEMPLATES["get_short_addr"], request.TSN)
 
     @reply_to(c.APS.DataReq.Req(partial=True, DstEndpoint=0))
     def on_zdo_request(self, req):
@@ -572,41 +838,22 @@ class BaseZbossDevice(BaseServerZBOSS):
     @reply_to(c.NcpConfig.GetZigbeeRole.Req(partial=True))
     def get_zigbee_role(self, request):
         """Handle get zigbee role."""
-        return c.NcpConfig.GetZigbeeRole.Rsp(
-            TSN=request.TSN,
-            StatusCat=t.StatusCategory(1),
-            StatusCode=t.StatusCodeGeneric.OK,
-            DeviceRole=t.DeviceRole(1)  # Example role
-        )
+        return with_tsn(self._TEMPLATES["get_zigbee_role"], request.TSN)
 
     @reply_to(c.NcpConfig.GetExtendedPANID.Req(partial=True))
     def get_extended_panid(self, request):
         """Handle get extended PANID."""
-        return c.NcpConfig.GetExtendedPANID.Rsp(
-            TSN=request.TSN,
-            StatusCat=t.StatusCategory(1),
-            StatusCode=t.StatusCodeGeneric.OK,
-            ExtendedPANID=t.EUI64.convert("00124b0001ab89cd")  # Example PAN ID
-        )
+        return with_tsn(self._TEMPLATES["get_extended_panid"], request.TSN)
 
     @reply_to(c.ZDO.PermitJoin.Req(partial=True))
     def get_permit_join(self, request):
         """Handle get permit join."""
-        return c.ZDO.PermitJoin.Rsp(
-            TSN=request.TSN,
-            StatusCat=t.StatusCategory(1),
-            StatusCode=t.StatusCodeGeneric.OK,
-        )
+        return with_tsn(self._TEMPLATES["get_permit_join"], request.TSN)
 
     @reply_to(c.NcpConfig.GetShortPANID.Req(partial=True))
     def get_short_panid(self, request):
         """Handle get short PANID."""
-        return c.NcpConfig.GetShortPANID.Rsp(
-            TSN=request.TSN,
-            StatusCat=t.StatusCategory(1),
-            StatusCode=t.StatusCodeGeneric.OK,
-            PANID=t.PanId(0x5678)  # Example short PAN ID
-        )
+        return with_tsn(self._TEMPLATES["get_short_panid"], request.TSN)
 
     @reply_to(c.NcpConfig.GetCurrentChannel.Req(partial=True))
     def get_current_channel(self, request):
@@ -627,109 +874,18 @@ class BaseZbossDevice(BaseServerZBOSS):
     @reply_to(c.NcpConfig.GetChannelMask.Req(partial=True))
     def get_channel_mask(self, request):
         """Handle get channel mask."""
-        return c.NcpConfig.GetChannelMask.Rsp(
-            TSN=request.TSN,
-            StatusCat=t.StatusCategory(1),
-            StatusCode=t.StatusCodeGeneric.OK,
-            ChannelList=t.ChannelEntryList(
-                [t.ChannelEntry(page=1, channel_mask=0x07fff800)])
-        )  # Example mask
+        return with_tsn(self._TEMPLATES["get_channel_mask"], request.TSN)
 
     @reply_to(c.NcpConfig.ReadNVRAM.Req(partial=True))
     def read_nvram(self, request):
         """Handle NVRAM read."""
-        status_code = t.StatusCodeGeneric.ERROR
-        if request.DatasetId == t.DatasetId.ZB_NVRAM_COMMON_DATA:
-            status_code = t.StatusCodeGeneric.OK
-            dataset = t.DSCommonData(
-                byte_count=100,
-                bitfield=1,
-                depth=1,
-                nwk_manager_addr=0x0000,
-                panid=0x1234,
-                network_addr=0x5678,
-                channel_mask=t.Channels(14),
-                aps_extended_panid=t.EUI64.convert("00:11:22:33:44:55:66:77"),
-                nwk_extended_panid=t.EUI64.convert("00:11:22:33:44:55:66:77"),
-                parent_addr=t.EUI64.convert("00:11:22:33:44:55:66:77"),
-                tc_addr=t.EUI64.convert("00:11:22:33:44:55:66:77"),
-                nwk_key=t.KeyData(b'\x01' * 16),
-                nwk_key_seq=0,
-                tc_standard_key=t.KeyData(b'\x02' * 16),
-                channel=15,
-                page=0,
-                mac_interface_table=t.MacInterfaceTable(
-                    bitfield_0=0,
-                    bitfield_1=1,
-                    link_pwr_data_rate=250,
-                    channel_in_use=11,
-                    supported_channels=t.Channels(15)
-                ),
-                reserved=0
-            )
-            nvram_version = 3
-            dataset_version = 1
-        elif request.DatasetId == t.DatasetId.ZB_IB_COUNTERS:
-            status_code = t.StatusCodeGeneric.OK
-            dataset = t.DSIbCounters(
-                byte_count=8,
-                nib_counter=100,  # Example counter value
-                aib_counter=50  # Example counter value
-            )
-            nvram_version = 1
-            dataset_version = 1
-        elif request.DatasetId == t.DatasetId.ZB_NVRAM_ADDR_MAP:
-            status_code = t.StatusCodeGeneric.OK
-            dataset = t.DSNwkAddrMap(
-                header=t.NwkAddrMapHeader(
-                    byte_count=100,
-                    entry_count=2,
-                    _align=0
-                ),
-                items=[
-                    t.NwkAddrMapRecord(
-                        ieee_addr=t.EUI64.convert("00:11:22:33:44:55:66:77"),
-                        nwk_addr=0x1234,
-                        index=1,
-                        redirect_type=0,
-                        redirect_ref=0,
-                        _align=0
-                    ),
-                    t.NwkAddrMapRecord(
-                        ieee_addr=t.EUI64.convert("00:11:22:33:44:55:66:78"),
-                        nwk_addr=0x5678,
-                        index=2,
-                        redirect_type=0,
-                        redirect_ref=0,
-                        _align=0
-                    )
-                ]
-            )
-            nvram_version = 2
-            dataset_version = 1
-        elif request.DatasetId == t.DatasetId.ZB_NVRAM_APS_SECURE_DATA:
-            status_code = t.StatusCodeGeneric.OK
-            dataset = t.DSApsSecureKeys(
-                header=10,
-                items=[
-                    t.ApsSecureEntry(
-                        ieee_addr=t.EUI64.convert("00:11:22:33:44:55:66:77"),
-                        key=t.KeyData(b'\x03' * 16),
-                        _unknown_1=0
-                    ),
-                    t.ApsSecureEntry(
-                        ieee_addr=t.EUI64.convert("00:11:22:33:44:55:66:78"),
-                        key=t.KeyData(b'\x04' * 16),
-                        _unknown_1=0
-                    )
-                ]
-            )
-            nvram_version = 1
-            dataset_version = 1
+        entry = NVRAM_TABLE.get(request.DatasetId)
+        if entry is None:
+            status_code = t.StatusCodeGeneric.ERROR
+            dataset, nvram_version, dataset_version = NVRAM_EMPTY, 1, 1
         else:
-            dataset = t.NVRAMDataset(b'')
-            nvram_version = 1
-            dataset_version = 1
+            status_code = t.StatusCodeGeneric.OK
+            dataset, nvram_version, dataset_version = entry
 
         return c.NcpConfig.ReadNVRAM.Rsp(
             TSN=request.TSN,
@@ -738,109 +894,61 @@ class BaseZbossDevice(BaseServerZBOSS):
             NVRAMVersion=nvram_version,
             DatasetId=t.DatasetId(request.DatasetId),
             DatasetVersion=dataset_version,
-            Dataset=t.NVRAMDataset(dataset.serialize())
+            Dataset=dataset
         )
 
     @reply_to(c.NcpConfig.GetTrustCenterAddr.Req(partial=True))
     def get_trust_center_addr(self, request):
         """Handle get trust center address."""
-        return c.NcpConfig.GetTrustCenterAddr.Rsp(
-            TSN=request.TSN,
-            StatusCat=t.StatusCategory(1),
-            StatusCode=t.StatusCodeGeneric.OK,
-            TCIEEE=t.EUI64.convert("00:11:22:33:44:55:66:77")
-            # Example Trust Center IEEE address
-        )
+        return with_tsn(self._TEMPLATES["get_trust_center_addr"], request.TSN)
 
     @reply_to(c.NcpConfig.GetRxOnWhenIdle.Req(partial=True))
     def get_rx_on_when_idle(self, request):
         """Handle get RX on when idle."""
-        return c.NcpConfig.GetRxOnWhenIdle.Rsp(
-            TSN=request.TSN,
-            StatusCat=t.StatusCategory(1),
-            StatusCode=t.StatusCodeGeneric.OK,
-            RxOnWhenIdle=1  # Example RxOnWhenIdle value
-        )
+        return with_tsn(self._TEMPLATES["get_rx_on_when_idle"], request.TSN)
 
     @reply_to(c.NWK.StartWithoutFormation.Req(partial=True))
     def start_without_formation(self, request):
         """Handle start without formation."""
-        return c.NWK.StartWithoutFormation.Rsp(
-            TSN=request.TSN,
-            StatusCat=t.StatusCategory(1),
-            StatusCode=t.StatusCodeGeneric.OK  # Example status code
-        )
+        return with_tsn(
+            self._TEMPLATES["start_without_formation"], request.TSN)
 
     @reply_to(c.NcpConfig.GetModuleVersion.Req(partial=True))
     def get_module_version(self, request):
         """Handle get module version."""
-        return c.NcpConfig.GetModuleVersion.Rsp(
-            TSN=request.TSN,
-            StatusCat=t.StatusCategory(1),
-            StatusCode=t.StatusCodeGeneric.OK,  # Example status code
-            FWVersion=1,  # Example firmware version
-            StackVersion=2,  # Example stack version
-            ProtocolVersion=3  # Example protocol version
-        )
+        return with_tsn(self._TEMPLATES["get_module_version"], request.TSN)
 
     @reply_to(c.AF.SetSimpleDesc.Req(partial=True))
     def set_simple_desc(self, request):
         """Handle set simple descriptor."""
-        return c.AF.SetSimpleDesc.Rsp(
-            TSN=request.TSN,
-            StatusCat=t.StatusCategory(1),
-            StatusCode=t.StatusCodeGeneric.OK  # Example status code
-        )
+        return with_tsn(self._TEMPLATES["set_simple_desc"], request.TSN)
 
     @reply_to(c.NcpConfig.GetEDTimeout.Req(partial=True))
     def get_ed_timeout(self, request):
         """Handle get EndDevice timeout."""
-        return c.NcpConfig.GetEDTimeout.Rsp(
-            TSN=request.TSN,
-            StatusCat=t.StatusCategory(1),
-            StatusCode=t.StatusCodeGeneric.OK,
-            Timeout=t.TimeoutIndex(0x01)  # Example timeout value
-        )
+        return with_tsn(self._TEMPLATES["get_ed_timeout"], request.TSN)
 
     @reply_to(c.NcpConfig.GetMaxChildren.Req(partial=True))
     def get_max_children(self, request):
         """Handle get max children."""
-        return c.NcpConfig.GetMaxChildren.Rsp(
-            TSN=request.TSN,
-            StatusCat=t.StatusCategory(1),
-            StatusCode=t.StatusCodeGeneric.OK,
-            ChildrenNbr=5  # Example max children
-        )
+        return with_tsn(self._TEMPLATES["get_max_children"], request.TSN)
 
     @reply_to(c.NcpConfig.GetAuthenticationStatus.Req(partial=True))
     def get_authentication_status(self, request):
         """Handle get authentication status."""
-        return c.NcpConfig.GetAuthenticationStatus.Rsp(
-            TSN=request.TSN,
-            StatusCat=t.StatusCategory(1),
-            StatusCode=t.StatusCodeGeneric.OK,
-            Authenticated=1  # Example authenticated value
-        )
+        return with_tsn(
+            self._TEMPLATES["get_authentication_status"], request.TSN)
 
     @reply_to(c.NcpConfig.GetParentAddr.Req(partial=True))
     def get_parent_addr(self, request):
         """Handle get parent address."""
-        return c.NcpConfig.GetParentAddr.Rsp(
-            TSN=request.TSN,
-            StatusCat=t.StatusCategory(1),
-            StatusCode=t.StatusCodeGeneric.OK,
-            NWKParentAddr=t.NWK(0x1234)  # Example parent NWK address
-        )
+        return with_tsn(self._TEMPLATES["get_parent_addr"], request.TSN)
 
     @reply_to(c.NcpConfig.GetCoordinatorVersion.Req(partial=True))
     def get_coordinator_version(self, request):
         """Handle get coordinator version."""
-        return c.NcpConfig.GetCoordinatorVersion.Rsp(
-            TSN=request.TSN,
-            StatusCat=t.StatusCategory(1),
-            StatusCode=t.StatusCodeGeneric.OK,
-            CoordinatorVersion=1  # Example coordinator version
-        )
+        return with_tsn(
+            self._TEMPLATES["get_coordinator_version"], request.TSN)
 
     def on_zdo_node_desc_req(self, req, NWKAddrOfInterest):
         """Handle node description request."""
@@ -900,10 +1008,8 @@ class BaseZbossGenericDevice(BaseServerZBOSS):
         self._orig_nvram = {}
         self.device_state = 0x00
         self.zdo_callbacks = set()
-        for name in dir(self):
-            func = getattr(self, name)
-            for req in getattr(func, "_reply_to", []):
-                self.reply_to(request=req, responses=[func])
+        for req, name in type(self)._get_reply_to_table():
+            self.reply_to(request=req, responses=[getattr(self, name)])
 
     def connection_lost(self, exc):
         """Lost connection."""
@@ -913,98 +1019,13 @@ class BaseZbossGenericDevice(BaseServerZBOSS):
     @reply_to(c.NcpConfig.ReadNVRAM.Req(partial=True))
     def read_nvram(self, request):
         """Handle NVRAM read."""
-        status_code = t.StatusCodeGeneric.ERROR
-        if request.DatasetId == t.DatasetId.ZB_NVRAM_COMMON_DATA:
-            status_code = t.StatusCodeGeneric.OK
-            dataset = t.DSCommonData(
-                byte_count=100,
-                bitfield=1,
-                depth=1,
-                nwk_manager_addr=0x0000,
-                panid=0x1234,
-                network_addr=0x5678,
-                channel_mask=t.Channels(14),
-                aps_extended_panid=t.EUI64.convert("00:11:22:33:44:55:66:77"),
-                nwk_extended_panid=t.EUI64.convert("00:11:22:33:44:55:66:77"),
-                parent_addr=t.EUI64.convert("00:11:22:33:44:55:66:77"),
-                tc_addr=t.EUI64.convert("00:11:22:33:44:55:66:77"),
-                nwk_key=t.KeyData(b'\x01' * 16),
-                nwk_key_seq=0,
-                tc_standard_key=t.KeyData(b'\x02' * 16),
-                channel=15,
-                page=0,
-                mac_interface_table=t.MacInterfaceTable(
-                    bitfield_0=0,
-                    bitfield_1=1,
-                    link_pwr_data_rate=250,
-                    channel_in_use=11,
-                    supported_channels=t.Channels(15)
-                ),
-                reserved=0
-            )
-            nvram_version = 3
-            dataset_version = 1
-        elif request.DatasetId == t.DatasetId.ZB_IB_COUNTERS:
-            status_code = t.StatusCodeGeneric.OK
-            dataset = t.DSIbCounters(
-                byte_count=8,
-                nib_counter=100,  # Example counter value
-                aib_counter=50  # Example counter value
-            )
-            nvram_version = 1
-            dataset_version = 1
-        elif request.DatasetId == t.DatasetId.ZB_NVRAM_ADDR_MAP:
-            status_code = t.StatusCodeGeneric.OK
-            dataset = t.DSNwkAddrMap(
-                header=t.NwkAddrMapHeader(
-                    byte_count=100,
-                    entry_count=2,
-                    _align=0
-                ),
-                items=[
-                    t.NwkAddrMapRecord(
-                        ieee_addr=t.EUI64.convert("00:11:22:33:44:55:66:77"),
-                        nwk_addr=0x1234,
-                        index=1,
-                        redirect_type=0,
-                        redirect_ref=0,
-                        _align=0
-                    ),
-                    t.NwkAddrMapRecord(
-                        ieee_addr=t.EUI64.convert("00:11:22:33:44:55:66:78"),
-                        nwk_addr=0x5678,
-                        index=2,
-                        redirect_type=0,
-                        redirect_ref=0,
-                        _align=0
-                    )
-                ]
-            )
-            nvram_version = 2
-            dataset_version = 1
-        elif request.DatasetId == t.DatasetId.ZB_NVRAM_APS_SECURE_DATA:
-            status_code = t.StatusCodeGeneric.OK
-            dataset = t.DSApsSecureKeys(
-                header=10,
-                items=[
-                    t.ApsSecureEntry(
-                        ieee_addr=t.EUI64.convert("00:11:22:33:44:55:66:77"),
-                        key=t.KeyData(b'\x03' * 16),
-                        _unknown_1=0
-                    ),
-                    t.ApsSecureEntry(
-                        ieee_addr=t.EUI64.convert("00:11:22:33:44:55:66:78"),
-                        key=t.KeyData(b'\x04' * 16),
-                        _unknown_1=0
-                    )
-                ]
-            )
-            nvram_version = 1
-            dataset_version = 1
+        entry = NVRAM_TABLE.get(request.DatasetId)
+        if entry is None:
+            status_code = t.StatusCodeGeneric.ERROR
+            dataset, nvram_version, dataset_version = NVRAM_EMPTY, 1, 1
         else:
-            dataset = t.NVRAMDataset(b'')
-            nvram_version = 1
-            dataset_version = 1
+            status_code = t.StatusCodeGeneric.OK
+            dataset, nvram_version, dataset_version = entry
 
         return c.NcpConfig.ReadNVRAM.Rsp(
             TSN=request.TSN,
@@ -1013,7 +1034,7 @@ class BaseZbossGenericDevice(BaseServerZBOSS):
             NVRAMVersion=nvram_version,
             DatasetId=t.DatasetId(request.DatasetId),
             DatasetVersion=dataset_version,
-            Dataset=t.NVRAMDataset(dataset.serialize())
+            Dataset=dataset
         )
 
     def on_zdo_node_desc_req(self, req, NWKAddrOfInterest):
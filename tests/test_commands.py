@@ -1,71 +1,111 @@
 """Test commands."""
 import dataclasses
+import itertools
 import keyword
-from collections import defaultdict
 
 import pytest
 
 import zigpy_zboss.commands as c
 from zigpy_zboss import types as t
 
+_KEYWORDS = frozenset(keyword.kwlist)
+_ALL_COMMANDS = tuple(itertools.chain.from_iterable(c.ALL_COMMANDS))
+
+_GMV_RSP_HEADER = {
+    "TSN": 10,
+    "StatusCat": t.StatusCategory(1),
+    "StatusCode": t.StatusCodeGeneric.OK,
+}
+_GMV_RSP_KWARGS = {
+    **_GMV_RSP_HEADER,
+    "FWVersion": 123456,
+    "StackVersion": 789012,
+    "ProtocolVersion": 345678,
+}
+_GMV_RSP = c.NcpConfig.GetModuleVersion.Rsp(**_GMV_RSP_KWARGS)
+_GMV_RSP_DATA = bytes.fromhex("0A010040E20100140A0C004E460500")
+
+_IEEE = t.EUI64([0, 11, 22, 33, 44, 55, 66, 77])
+_NWK = t.NWK(0x1234)
+_ASSOC = [t.NWK(0x0001), t.NWK(0x0002)]
+
+
+# Schemas are class-level tuples, validated ones are remembered by identity
+_VALIDATED_SCHEMAS = set()
+
 
 def _validate_schema(schema):
     """Validate the schema for command parameters."""
-    for index, param in enumerate(schema):
+    if id(schema) in _VALIDATED_SCHEMAS:
+        return
+
+    seen_optional = False
+
+    for param in schema:
         assert isinstance(param.name, str)
         assert param.name.isidentifier()
-        assert not keyword.iskeyword(param.name)
+        assert param.name not in _KEYWORDS
         assert isinstance(param.type, type)
         assert isinstance(param.description, str)
 
         # All optional params must be together at the end
-        if param.optional:
-            assert all(p.optional for p in schema[index:])
+        assert param.optional or not seen_optional
+        seen_optional |= param.optional
+
+    _VALIDATED_SCHEMAS.add(id(schema))
+
+
+def _check_req_schema(cmd):
+    """Check a request command and its response."""
+    assert cmd.type == cmd.Req.header.control_type
+    assert cmd.Rsp.header.control_type == t.ControlType.RSP
+
+    assert isinstance(cmd.Req.header, t.HLCommonHeader)
+    assert isinstance(cmd.Rsp.header, t.HLCommonHeader)
+
+    assert cmd.Req.Rsp is cmd.Rsp
+    assert cmd.Rsp.Req is cmd.Req
+    assert cmd.Ind is None
 
+    _validate_schema(cmd.Req.schema)
+    _validate_schema(cmd.Rsp.schema)
 
-def test_commands_schema():
-    """Test the schema of all commands."""
-    commands_by_id = defaultdict(list)
 
-    for commands in c.ALL_COMMANDS:
-        for cmd in commands:
-            if cmd.definition.control_type == t.ControlType.REQ:
-                assert cmd.type == cmd.Req.header.control_type
-                assert cmd.Rsp.header.control_type == t.ControlType.RSP
+def _check_ind_schema(cmd):
+    """Check an indication command."""
+    assert cmd.Req is None
+    assert cmd.Rsp is None
 
-                assert isinstance(cmd.Req.header, t.HLCommonHeader)
-                assert isinstance(cmd.Rsp.header, t.HLCommonHeader)
+    assert cmd.type == cmd.Ind.header.control_type
 
-                assert cmd.Req.Rsp is cmd.Rsp
-                assert cmd.Rsp.Req is cmd.Req
-                assert cmd.Ind is None
+    assert cmd.Ind.header.control_type == t.ControlType.IND
 
-                _validate_schema(cmd.Req.schema)
-                _validate_schema(cmd.Rsp.schema)
+    assert isinstance(cmd.Ind.header, t.HLCommonHeader)
 
-                commands_by_id[cmd.Req.header].append(cmd.Req)
-                commands_by_id[cmd.Rsp.header].append(cmd.Rsp)
+    _validate_schema(cmd.Ind.schema)
 
-            elif cmd.type == t.ControlType.IND:
-                assert cmd.Req is None
-                assert cmd.Rsp is None
 
-                assert cmd.type == cmd.Ind.header.control_type
+_SCHEMA_CHECKS = {
+    t.ControlType.REQ: _check_req_schema,
+    t.ControlType.IND: _check_ind_schema,
+}
 
-                assert cmd.Ind.header.control_type == t.ControlType.IND
 
-                assert isinstance(cmd.Ind.header, t.HLCommonHeader)
+@pytest.mark.parametrize("cmd", _ALL_COMMANDS)
+def test_command_schema(cmd):
+    """Test the schema of a single command."""
+    check = _SCHEMA_CHECKS.get(cmd.definition.control_type)
 
-                _validate_schema(cmd.Ind.schema)
+    if check is None:
+        pytest.fail(f"Command has unknown type: {cmd}")
 
-                commands_by_id[cmd.Ind.header].append(cmd.Ind)
-            else:
-                assert False, "Command has unknown type"  # noqa: B011
+    check(cmd)
+
+
+def test_commands_unique(all_commands_index):
+    """Test that no two commands share a header."""
+    commands_by_id, duplicate_commands = all_commands_index
 
-    duplicate_commands = {
-        cmd: commands for cmd,
-        commands in commands_by_id.items() if len(commands) > 1
-    }
     assert not duplicate_commands
 
     assert len(commands_by_id.keys()) == len(c.COMMANDS_BY_ID.keys())
@@ -152,8 +192,8 @@ def test_command_optional_params():
         TSN=10,
         StatusCat=t.StatusCategory(1),
         StatusCode=t.StatusCodeGeneric.OK,
-        RemoteDevIEEE=t.EUI64([00, 11, 22, 33, 44, 55, 66, 77]),
-        RemoteDevNWK=t.NWK(0x1234)
+        RemoteDevIEEE=_IEEE,
+        RemoteDevNWK=_NWK
     )
 
     # Full response including optional parameters
@@ -161,15 +201,17 @@ def test_command_optional_params():
         TSN=10,
         StatusCat=t.StatusCategory(1),
         StatusCode=t.StatusCodeGeneric.OK,
-        RemoteDevIEEE=t.EUI64([00, 11, 22, 33, 44, 55, 66, 77]),
-        RemoteDevNWK=t.NWK(0x1234),
+        RemoteDevIEEE=_IEEE,
+        RemoteDevNWK=_NWK,
         NumAssocDev=5,
         StartIndex=0,
-        AssocDevNWKList=[t.NWK(0x0001), t.NWK(0x0002)]
+        AssocDevNWKList=_ASSOC
     )
 
-    basic_data = basic_ieee_addr_rsp.to_frame().hl_packet.data
-    full_data = full_ieee_addr_rsp.to_frame().hl_packet.data
+    basic_frame = basic_ieee_addr_rsp.to_frame()
+    full_frame = full_ieee_addr_rsp.to_frame()
+    basic_data = basic_frame.hl_packet.data
+    full_data = full_frame.hl_packet.data
 
     # Check if full data contains optional parameters
     assert len(full_data) >= len(basic_data)
@@ -179,47 +221,37 @@ def test_command_optional_params():
 
     # Deserialization checks
     IeeeAddrReq = c.ZDO.IeeeAddrReq.Rsp
-    assert (
-            IeeeAddrReq.from_frame(basic_ieee_addr_rsp.to_frame())
-            == basic_ieee_addr_rsp
-    )
-    assert (
-            IeeeAddrReq.from_frame(full_ieee_addr_rsp.to_frame())
-            == full_ieee_addr_rsp
-    )
+    assert IeeeAddrReq.from_frame(basic_frame) == basic_ieee_addr_rsp
+    assert IeeeAddrReq.from_frame(full_frame) == full_ieee_addr_rsp
 
 
-def test_command_optional_params_failures():
-    """Test optional parameters failures."""
-    with pytest.raises(KeyError):
-        # Optional params cannot be skipped over
-        c.ZDO.IeeeAddrReq.Rsp(
-            TSN=10,
-            StatusCat=t.StatusCategory(1),
-            StatusCode=t.StatusCodeGeneric.OK,
-            RemoteDevIEEE=t.EUI64([00, 11, 22, 33, 44, 55, 66, 77]),
-            RemoteDevNWK=t.NWK(0x1234),
-            NumAssocDev=5,
-            # StartIndex=0,
-            AssocDevNWKList=[t.NWK(0x0001), t.NWK(0x0002)]
-        )
+# StartIndex is skipped over even though AssocDevNWKList comes after it
+_IEEE_ADDR_RSP_SKIPPED_KWARGS = {
+    "TSN": 10,
+    "StatusCat": t.StatusCategory(1),
+    "StatusCode": t.StatusCodeGeneric.OK,
+    "RemoteDevIEEE": _IEEE,
+    "RemoteDevNWK": _NWK,
+    "NumAssocDev": 5,
+    "AssocDevNWKList": _ASSOC,
+}
 
-    # Unless it's a partial command
-    partial = c.ZDO.IeeeAddrReq.Rsp(
-        TSN=10,
-        StatusCat=t.StatusCategory(1),
-        StatusCode=t.StatusCodeGeneric.OK,
-        RemoteDevIEEE=t.EUI64([00, 11, 22, 33, 44, 55, 66, 77]),
-        RemoteDevNWK=t.NWK(0x1234),
-        NumAssocDev=5,
-        # StartIndex=0,
-        AssocDevNWKList=[t.NWK(0x0001), t.NWK(0x0002)],
-        partial=True
-    )
 
-    # In which case, it cannot be serialized
-    with pytest.raises(ValueError):
-        partial.to_frame()
+@pytest.mark.parametrize(
+    "partial, exception",
+    [
+        # Optional params cannot be skipped over
+        (False, KeyError),
+        # Unless it's a partial command, in which case it cannot be serialized
+        (True, ValueError),
+    ],
+)
+def test_command_optional_params_failures(partial, exception):
+    """Test optional parameters failures."""
+    with pytest.raises(exception):
+        c.ZDO.IeeeAddrReq.Rsp(
+            **_IEEE_ADDR_RSP_SKIPPED_KWARGS, partial=partial
+        ).to_frame()
 
 
 def test_simple_descriptor():
@@ -333,9 +365,7 @@ def test_command_serialization():
     )
     frame = command.to_frame()
 
-    assert frame.hl_packet.data == bytes.fromhex(
-        "0A010040E20100140A0C004E460500"
-    )
+    assert frame.hl_packet.data == _GMV_RSP_DATA
 
     # Partial frames cannot be serialized
     with pytest.raises(ValueError):
@@ -365,33 +395,28 @@ def test_command_serialization():
         partial2.to_frame()
 
 
-def test_command_equality():
-    """Test command equality."""
-    command1 = c.NcpConfig.GetModuleVersion.Rsp(
-        TSN=10,
-        StatusCat=t.StatusCategory(1),
-        StatusCode=t.StatusCodeGeneric.OK,
-        FWVersion=123456,
-        StackVersion=789012,
-        ProtocolVersion=345678
-    )
+def test_command_struct_serialization():
+    """Test fixed integer schemas are packed with a single struct."""
+    command = c.NcpConfig.SetShortPANID.Req(TSN=10, PANID=0x1234)
+
+    assert type(command)._struct is not None
+    assert c.NcpConfig.GetModuleVersion.Rsp._struct is None
+
+    frame = command.to_frame()
+    assert frame.hl_packet.data == b"\x0A\x34\x12"
+
+    parsed = type(command).from_frame(frame)
+    assert parsed == command
+    assert type(parsed.PANID) is t.PanId
 
-    command2 = c.NcpConfig.GetModuleVersion.Rsp(
-        TSN=10,
-        StatusCat=t.StatusCategory(1),
-        StatusCode=t.StatusCodeGeneric.OK,
-        FWVersion=123456,
-        StackVersion=789012,
-        ProtocolVersion=345678
-    )
 
+def test_command_equality():
+    """Test command equality."""
+    command1 = _GMV_RSP
+    # Built separately so equality is checked by value, not identity
+    command2 = c.NcpConfig.GetModuleVersion.Rsp(**_GMV_RSP_KWARGS)
     command3 = c.NcpConfig.GetModuleVersion.Rsp(
-        TSN=20,
-        StatusCat=t.StatusCategory(1),
-        StatusCode=t.StatusCodeGeneric.OK,
-        FWVersion=123456,
-        StackVersion=789012,
-        ProtocolVersion=345678
+        **{**_GMV_RSP_KWARGS, "TSN": 20}
     )
 
     assert command1 == command1
@@ -408,41 +433,21 @@ def test_command_equality():
     assert not command3.matches(command1)
 
     assert not command1.matches(
-        c.NcpConfig.GetModuleVersion.Rsp(
-            TSN=10,
-            StatusCat=t.StatusCategory(1),
-            StatusCode=t.StatusCodeGeneric.OK,
-            partial=True
-        )
+        c.NcpConfig.GetModuleVersion.Rsp(**_GMV_RSP_HEADER, partial=True)
     )
     assert c.NcpConfig.GetModuleVersion.Rsp(
-        TSN=10,
-        StatusCat=t.StatusCategory(1),
-        StatusCode=t.StatusCodeGeneric.OK,
-        partial=True
+        **_GMV_RSP_HEADER, partial=True
     ).matches(command1)
 
     # parameters can be specified explicitly as None
     assert c.NcpConfig.GetModuleVersion.Rsp(
-        TSN=10,
-        StatusCat=t.StatusCategory(1),
-        StatusCode=t.StatusCodeGeneric.OK,
-        StackVersion=None,
-        partial=True
+        **_GMV_RSP_HEADER, StackVersion=None, partial=True
     ).matches(command1)
     assert c.NcpConfig.GetModuleVersion.Rsp(
-        TSN=10,
-        StatusCat=t.StatusCategory(1),
-        StatusCode=t.StatusCodeGeneric.OK,
-        StackVersion=789012,
-        partial=True
+        **_GMV_RSP_HEADER, StackVersion=789012, partial=True
     ).matches(command1)
     assert not c.NcpConfig.GetModuleVersion.Rsp(
-        TSN=10,
-        StatusCat=t.StatusCategory(1),
-        StatusCode=t.StatusCodeGeneric.OK,
-        StackVersion=79000,
-        partial=True
+        **_GMV_RSP_HEADER, StackVersion=79000, partial=True
     ).matches(command1)
 
     # Different frame types do not match, even if they have the same structure
@@ -464,14 +469,12 @@ def test_command_deserialization():
         ProtocolVersion=345678
     )
 
-    assert type(command).from_frame(command.to_frame()) == command
-    assert (
-            command.to_frame() ==
-            type(command).from_frame(command.to_frame()).to_frame()
-    )
+    frame = command.to_frame()
+
+    assert type(command).from_frame(frame) == command
+    assert frame == type(command).from_frame(frame).to_frame()
 
     # Deserialization fails if there is unparsed data at the end of the frame
-    frame = command.to_frame()
     new_hl_packet = dataclasses.replace(
         frame.hl_packet, data=frame.hl_packet.data + b"\x01"
     )
@@ -4,20 +4,19 @@ from voluptuous import Invalid
 
 import zigpy_zboss.config as conf
 
+# CONFIG_SCHEMA is already a compiled schema, only the input is shared
+_BASE_CONFIG = {conf.CONF_DEVICE: {conf.CONF_DEVICE_PATH: "/dev/null"}}
+
 
 def test_pin_states_same_lengths():
     """Test same lengths pin states."""
     # Bare schema works
-    conf.CONFIG_SCHEMA(
-        {
-            conf.CONF_DEVICE: {conf.CONF_DEVICE_PATH: "/dev/null"},
-        }
-    )
+    conf.CONFIG_SCHEMA(_BASE_CONFIG)
 
     # So does one with explicitly specified pin states
     config = conf.CONFIG_SCHEMA(
         {
-            conf.CONF_DEVICE: {conf.CONF_DEVICE_PATH: "/dev/null"},
+            **_BASE_CONFIG,
             conf.CONF_ZBOSS_CONFIG: {
                 conf.CONF_CONNECT_RTS_STATES: ["on", True, 0, 0, 0, 1, 1],
                 conf.CONF_CONNECT_DTR_STATES: ["off", False, 1, 0, 0, 1, 1],
@@ -51,7 +50,7 @@ def test_pin_states_different_lengths():
     with pytest.raises(Invalid):
         conf.CONFIG_SCHEMA(
             {
-                conf.CONF_DEVICE: {conf.CONF_DEVICE_PATH: "/dev/null"},
+                **_BASE_CONFIG,
                 conf.CONF_ZBOSS_CONFIG: {
                     conf.CONF_CONNECT_RTS_STATES: [1, 1, 0],
                     conf.CONF_CONNECT_DTR_STATES: [1, 1],
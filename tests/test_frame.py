@@ -2,8 +2,8 @@
 import pytest
 
 import zigpy_zboss.types as t
-from zigpy_zboss.frames import (CRC8, ZBNCP_LL_BODY_SIZE_MAX, Frame, HLPacket,
-                                InvalidFrame, LLHeader)
+from zigpy_zboss.frames import (CRC8, CRC16, ZBNCP_LL_BODY_SIZE_MAX, Frame,
+                                HLPacket, InvalidFrame, LLHeader)
 
 
 def test_frame_deserialization():
@@ -37,6 +37,12 @@ def test_frame_deserialization():
     assert frame.ll_header.crc8 == CRC8(ll_header_without_crc[2:6]).digest()
     assert frame.hl_packet.data == b"test_data"
 
+    # Deserializing a memoryview does not copy the remaining data
+    frame, rest = Frame.deserialize(memoryview(frame_data + extra_data))
+    assert isinstance(rest, memoryview)
+    assert rest == extra_data
+    assert frame.hl_packet.data == b"test_data"
+
     # Invalid frame signature
     invalid_signature_frame_data = t.uint16_t(0xFFFF).serialize() + frame_data[
                                                                     2:]
@@ -52,6 +58,72 @@ def test_frame_deserialization():
         Frame.deserialize(frame_data_without_crc)
 
 
+def test_ll_header_calculate_crc8():
+    """Test the LL header CRC8 is computed over size, type and flags."""
+    ll_header = LLHeader(
+        sign=0xADDE, size=0x0123, frame_type=0x01, flags=t.LLFlags.FirstFrag
+    )
+
+    expected = CRC8(ll_header.serialize()[2:6]).digest()
+    assert ll_header.calculate_crc8() == expected
+    assert ll_header.with_crc8(0xAA).calculate_crc8() == expected
+
+
+def test_ll_header_flags_int():
+    """Test the LL header flags can be read as a plain int."""
+    flags = t.LLFlags.FirstFrag | t.LLFlags.LastFrag
+    ll_header = LLHeader(sign=0xADDE, size=0x0123, flags=flags, crc8=0xAA)
+
+    assert ll_header.flags_int == ll_header.flags == flags
+    assert type(ll_header.flags_int) is int
+
+
+def test_crc8_buffer_input():
+    """Test CRC8 accepts any buffer without copying it."""
+    data = bytearray(b"\xDE\xAD\x05\x00\x06\x01")
+
+    assert CRC8(memoryview(data)[2:6]).digest() == CRC8(data[2:6]).digest()
+
+    with pytest.raises(TypeError):
+        CRC8("text")
+
+    with pytest.raises(TypeError):
+        CRC8([1, 2, 3])
+
+
+def test_crc16_slice_by_4():
+    """Test the four byte CRC16 loop matches the byte at a time loop."""
+    data = bytes(range(37))
+    crc = CRC16()
+    for i in range(len(data)):
+        crc.update(data[i:i + 1])
+
+    assert CRC16(data).digest() == crc.digest()
+    assert CRC16(memoryview(data)).digest() == crc.digest()
+
+
+def test_hl_common_header_get():
+    """Test HL common headers are shared between identical fields."""
+    header = t.HLCommonHeader.get(0x01, t.ControlType.RSP, 0x1234)
+
+    assert header == t.HLCommonHeader(
+        version=0x01, type=t.ControlType.RSP, id=0x1234
+    )
+    assert header is t.HLCommonHeader.get(0x01, t.ControlType.RSP, 0x1234)
+    assert header is not t.HLCommonHeader.get(0x01, t.ControlType.REQ, 0x1234)
+
+
+def test_hl_packet_serialize_cached():
+    """Test the HL packet is serialized and checksummed only once."""
+    header = t.HLCommonHeader(version=0x00, type=t.ControlType.RSP, id=0x1234)
+    hl_packet = HLPacket(header=header, data=t.Bytes(b"\x01\x02\x03"))
+    body = header.serialize() + b"\x01\x02\x03"
+
+    assert hl_packet.serialize() == CRC16(body).digest().serialize() + body
+    assert hl_packet.serialize() is hl_packet.serialize()
+    assert hl_packet == HLPacket(header=header, data=t.Bytes(b"\x01\x02\x03"))
+
+
 def test_ack_flag_deserialization():
     """Test frame deserialization with ACK flag."""
     ll_signature = t.uint16_t(0xADDE).serialize()
@@ -135,6 +207,9 @@ def test_handle_tx_fragmentation():
     total_fragments = frame.count_fragments()
     assert len(fragments) == total_fragments
 
+    # Fragments can also be built lazily
+    assert list(frame.iter_fragments()) == fragments
+
     # Calculate the expected size of the first fragment
     # Exclude the CRC16 for size calculation
     serialized_hl_packet = hl_packet.serialize()[2:]
@@ -135,6 +135,20 @@ def test_lvlist_too_short():
         TestList.deserialize(b"\x04123")
 
 
+def test_lvlist_int_items():
+    """Test lvlist of fixed size integers keeps the item type."""
+    class TestList(t.LVList, item_type=t.NWK, length_type=t.uint8_t):
+        pass
+
+    d, r = TestList.deserialize(b"\x02\x34\x12\xcd\xab\xff")
+    assert r == b"\xff"
+    assert d == [0x1234, 0xABCD]
+    assert all(type(item) is t.NWK for item in d)
+
+    with pytest.raises(ValueError):
+        TestList.deserialize(b"\x02\x34\x12\xcd")
+
+
 def test_fixed_list():
     """Test fixed list."""
     class TestList(t.FixedList, item_type=t.uint16_t, length=3):
@@ -10,6 +10,15 @@ from zigpy_zboss.checksum import CRC8
 from zigpy_zboss.frames import Frame
 
 
+_GARBAGE_PREFIX = bytes.fromhex("58 4a 72 35 51 da 60 ed 1f 03 6d b6 ee 90")
+_GARBAGE_SUFFIX = bytes.fromhex(
+    "00 00 e4 4f 51 b2 39 4b 8d e3 ca 61 8c 56 8a 2c d8 22 64 9e 9d 7b"
+)
+
+# One shared single-byte object per value, so dripping data allocates nothing
+_SINGLE_BYTES = tuple(bytes((byte,)) for byte in range(256))
+
+
 @pytest.fixture
 def connected_uart(mocker):
     """Uart connected fixture."""
@@ -32,6 +41,29 @@ def ll_checksum(frame):
     return frame
 
 
+def feed_byte_by_byte(uart, data):
+    """Pass data to the uart one byte at a time."""
+    for byte in data:
+        uart.data_received(_SINGLE_BYTES[byte])
+
+
+@pytest.fixture(scope="module")
+def sample_frame():
+    """Frame and its serialized bytes, built once for the whole module."""
+    test_command = c.NcpConfig.GetZigbeeRole.Rsp(
+            TSN=10,
+            StatusCat=t.StatusCategory(1),
+            StatusCode=t.StatusCodeGeneric.OK,
+            DeviceRole=t.DeviceRole(1)
+        )
+    test_frame = ll_checksum(test_command.to_frame())
+    test_frame_bytes = Frame(
+        test_frame.ll_header, test_frame.hl_packet
+    ).serialize()
+
+    return test_frame, test_frame_bytes
+
+
 @pytest.fixture
 def dummy_serial_conn(event_loop, mocker):
     """Connect serial dummy."""
@@ -68,21 +100,11 @@ def dummy_serial_conn(event_loop, mocker):
     return device, serial_interface
 
 
-def test_uart_rx_basic(connected_uart):
+def test_uart_rx_basic(connected_uart, sample_frame):
     """Test UART basic receive."""
     zboss, uart = connected_uart
 
-    test_command = c.NcpConfig.GetZigbeeRole.Rsp(
-            TSN=10,
-            StatusCat=t.StatusCategory(1),
-            StatusCode=t.StatusCodeGeneric.OK,
-            DeviceRole=t.DeviceRole(1)
-        )
-    test_frame = test_command.to_frame()
-    test_frame = ll_checksum(test_frame)
-    test_frame_bytes = Frame(
-        test_frame.ll_header, test_frame.hl_packet
-    ).serialize()
+    test_frame, test_frame_bytes = sample_frame
 
     uart.data_received(test_frame_bytes)
 
@@ -97,84 +119,38 @@ def test_uart_str_repr(connected_uart):
     repr(uart)
 
 
-def test_uart_rx_byte_by_byte(connected_uart):
+def test_uart_rx_byte_by_byte(connected_uart, sample_frame):
     """Test uart RX byte by byte."""
     zboss, uart = connected_uart
 
-    test_command = c.NcpConfig.GetZigbeeRole.Rsp(
-            TSN=10,
-            StatusCat=t.StatusCategory(1),
-            StatusCode=t.StatusCodeGeneric.OK,
-            DeviceRole=t.DeviceRole(1)
-        )
-    test_frame = test_command.to_frame()
-    test_frame = ll_checksum(test_frame)
-    test_frame_bytes = Frame(
-        test_frame.ll_header, test_frame.hl_packet
-    ).serialize()
+    test_frame, test_frame_bytes = sample_frame
 
-    for byte in test_frame_bytes:
-        uart.data_received(bytes([byte]))
+    feed_byte_by_byte(uart, test_frame_bytes)
 
     zboss.frame_received.assert_called_once_with(test_frame)
 
 
-def test_uart_rx_byte_by_byte_garbage(connected_uart):
+def test_uart_rx_byte_by_byte_garbage(connected_uart, sample_frame):
     """Test uart RX byte by byte garbage."""
     zboss, uart = connected_uart
 
-    test_command = c.NcpConfig.GetZigbeeRole.Rsp(
-            TSN=10,
-            StatusCat=t.StatusCategory(1),
-            StatusCode=t.StatusCodeGeneric.OK,
-            DeviceRole=t.DeviceRole(1)
-        )
-    test_frame = test_command.to_frame()
-    test_frame = ll_checksum(test_frame)
-    test_frame_bytes = Frame(
-        test_frame.ll_header, test_frame.hl_packet
-    ).serialize()
+    test_frame, test_frame_bytes = sample_frame
 
-    data = b""
-    data += bytes.fromhex("58 4a 72 35 51 da 60 ed 1f")
-    data += bytes.fromhex("03 6d b6")
-    data += bytes.fromhex("ee 90")
-    data += test_frame_bytes
-    data += bytes.fromhex("00 00")
-    data += bytes.fromhex("e4 4f 51 b2 39 4b 8d e3 ca 61")
-    data += bytes.fromhex("8c 56 8a 2c d8 22 64 9e 9d 7b")
+    data = _GARBAGE_PREFIX + test_frame_bytes + _GARBAGE_SUFFIX
 
     # The frame should be parsed identically regardless of framing
-    for byte in data:
-        uart.data_received(bytes([byte]))
+    feed_byte_by_byte(uart, data)
 
     zboss.frame_received.assert_called_once_with(test_frame)
 
 
-def test_uart_rx_big_garbage(connected_uart):
+def test_uart_rx_big_garbage(connected_uart, sample_frame):
     """Test uart RX big garbage."""
     zboss, uart = connected_uart
 
-    test_command = c.NcpConfig.GetZigbeeRole.Rsp(
-            TSN=10,
-            StatusCat=t.StatusCategory(1),
-            StatusCode=t.StatusCodeGeneric.OK,
-            DeviceRole=t.DeviceRole(1)
-        )
-    test_frame = test_command.to_frame()
-    test_frame = ll_checksum(test_frame)
-    test_frame_bytes = Frame(
-        test_frame.ll_header, test_frame.hl_packet
-    ).serialize()
+    test_frame, test_frame_bytes = sample_frame
 
-    data = b""
-    data += bytes.fromhex("58 4a 72 35 51 da 60 ed 1f")
-    data += bytes.fromhex("03 6d b6")
-    data += bytes.fromhex("ee 90")
-    data += test_frame_bytes
-    data += bytes.fromhex("00 00")
-    data += bytes.fromhex("e4 4f 51 b2 39 4b 8d e3 ca 61")
-    data += bytes.fromhex("8c 56 8a 2c d8 22 64 9e 9d 7b")
+    data = _GARBAGE_PREFIX + test_frame_bytes + _GARBAGE_SUFFIX
 
     # The frame should be parsed identically regardless of framing
     uart.data_received(data)
@@ -182,21 +158,11 @@ def test_uart_rx_big_garbage(connected_uart):
     zboss.frame_received.assert_called_once_with(test_frame)
 
 
-def test_uart_rx_corrupted_fcs(connected_uart):
+def test_uart_rx_corrupted_fcs(connected_uart, sample_frame):
     """Test uart RX corrupted."""
     zboss, uart = connected_uart
 
-    test_command = c.NcpConfig.GetZigbeeRole.Rsp(
-            TSN=10,
-            StatusCat=t.StatusCategory(1),
-            StatusCode=t.StatusCodeGeneric.OK,
-            DeviceRole=t.DeviceRole(1)
-        )
-    test_frame = test_command.to_frame()
-    test_frame = ll_checksum(test_frame)
-    test_frame_bytes = Frame(
-        test_frame.ll_header, test_frame.hl_packet
-    ).serialize()
+    _, test_frame_bytes = sample_frame
 
     # Almost, but not quite
     uart.data_received(test_frame_bytes[:-1])
@@ -205,21 +171,25 @@ def test_uart_rx_corrupted_fcs(connected_uart):
     assert not zboss.frame_received.called
 
 
-def test_uart_rx_sof_stress(connected_uart):
+def test_uart_rx_too_short_length(connected_uart, sample_frame):
+    """Test uart RX of a signature with an impossibly short length."""
+    zboss, uart = connected_uart
+
+    test_frame, test_frame_bytes = sample_frame
+
+    # A valid signature followed by an LL size smaller than the LL header
+    bogus_header = test_frame_bytes[:2] + b"\x02\x00\x06\x00\x00"
+
+    uart.data_received(bogus_header + test_frame_bytes)
+
+    zboss.frame_received.assert_called_once_with(test_frame)
+
+
+def test_uart_rx_sof_stress(connected_uart, sample_frame):
     """Test uart RX signature stress."""
     zboss, uart = connected_uart
 
-    test_command = c.NcpConfig.GetZigbeeRole.Rsp(
-            TSN=10,
-            StatusCat=t.StatusCategory(1),
-            StatusCode=t.StatusCodeGeneric.OK,
-            DeviceRole=t.DeviceRole(1)
-        )
-    test_frame = test_command.to_frame()
-    test_frame = ll_checksum(test_frame)
-    test_frame_bytes = Frame(
-        test_frame.ll_header, test_frame.hl_packet
-    ).serialize()
+    test_frame, test_frame_bytes = sample_frame
 
     # We include an almost-valid frame and many stray SoF markers
     uart.data_received(
@@ -234,22 +204,12 @@ def test_uart_rx_sof_stress(connected_uart):
     zboss.frame_received.assert_called_once_with(test_frame)
 
 
-def test_uart_frame_received_error(connected_uart, mocker):
+def test_uart_frame_received_error(connected_uart, sample_frame, mocker):
     """Test uart frame received error."""
     zboss, uart = connected_uart
     zboss.frame_received = mocker.Mock(side_effect=RuntimeError("An error"))
 
-    test_command = c.NcpConfig.GetZigbeeRole.Rsp(
-            TSN=10,
-            StatusCat=t.StatusCategory(1),
-            StatusCode=t.StatusCodeGeneric.OK,
-            DeviceRole=t.DeviceRole(1)
-        )
-    test_frame = test_command.to_frame()
-    test_frame = ll_checksum(test_frame)
-    test_frame_bytes = Frame(
-        test_frame.ll_header, test_frame.hl_packet
-    ).serialize()
+    _, test_frame_bytes = sample_frame
 
     # Errors thrown by zboss.frame_received should
     # not impact how many frames are handled
@@ -1,7 +1,7 @@
 """Test utils."""
 import zigpy_zboss.commands as c
 import zigpy_zboss.types as t
-from zigpy_zboss.utils import deduplicate_commands
+from zigpy_zboss.utils import IndicationListener, deduplicate_commands
 
 
 def test_command_deduplication_simple():
@@ -16,6 +16,18 @@ def test_command_deduplication_simple():
     assert deduplicate_commands([c2, c1, c2]) == (c2, c1)
 
 
+def test_command_deduplication_order():
+    """Test command deduplication keeps order across command types."""
+    c1 = c.NcpConfig.GetModuleVersion.Req(TSN=10)
+    c2 = c.NcpConfig.NCPModuleReset.Req(TSN=10, Option=t.ResetOptions(0))
+    c3 = c.NcpConfig.GetModuleVersion.Req(partial=True)
+    c4 = c.NcpConfig.GetModuleVersion.Req(TSN=11)
+
+    # A less specific command takes the place of the one it absorbs
+    assert deduplicate_commands([c1, c2, c3, c4]) == (c3, c2)
+    assert deduplicate_commands([c4, c2, c1]) == (c4, c2, c1)
+
+
 def test_command_deduplication_complex():
     """Test command deduplication complex."""
     result = deduplicate_commands(
@@ -105,3 +117,20 @@ def test_command_deduplication_complex():
             KeyNumber3=30,
         ),
     }
+
+
+def test_listener_matching_headers():
+    """Test listener headers are computed once from its commands."""
+    listener = IndicationListener(
+        [
+            c.NcpConfig.GetModuleVersion.Rsp(partial=True),
+            c.NcpConfig.GetZigbeeRole.Rsp(partial=True),
+        ],
+        callback=None,
+    )
+
+    assert listener.matching_headers() == (
+        c.NcpConfig.GetModuleVersion.Rsp.header,
+        c.NcpConfig.GetZigbeeRole.Rsp.header,
+    )
+    assert listener.matching_headers() is listener.matching_headers()
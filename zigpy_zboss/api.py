@@ -2,10 +2,9 @@
 from __future__ import annotations
 
 import asyncio
-import contextlib
-import itertools
+import functools
 import logging
-from collections import Counter, defaultdict
+from collections import Counter
 
 import async_timeout
 import zigpy.state
@@ -36,6 +35,20 @@ EXPECTED_DISCONNECT_TIMEOUT = 5.0
 MAX_RESET_RECONNECT_ATTEMPTS = 5
 RESET_RECONNECT_DELAY = 1.0
 
+_LAST_FRAG_MASK = int(t.LLFlags.LastFrag)
+# Bound once, since every received frame looks up its command class
+_get_command_cls = c.COMMANDS_BY_ID.get
+
+
+@functools.lru_cache(maxsize=None)
+def _partial_response(response_cls: type[t.CommandBase]) -> t.CommandBase:
+    """Return a shared partial response matching any `response_cls`.
+
+    Commands are immutable, so one instance per class can back every
+    request's listener.
+    """
+    return response_cls(partial=True)
+
 
 class ZBOSS:
     """Class linking zigpy with ZBOSS running on nRF SoC."""
@@ -46,14 +59,16 @@ class ZBOSS:
         self._app = None
         self._config = config
 
-        self._listeners = defaultdict(list)
+        self._listeners: dict[t.HLCommonHeader, list] = {}
+        self._listener_counts = Counter()
         self._blocking_request_lock = asyncio.Lock()
 
         self.nvram = NVRAMHelper(self)
         self.network_info: zigpy.state.NetworkInformation = None
         self.node_info: zigpy.state.NodeInfo = None
 
-        self._rx_fragments = []
+        # HL bodies of the fragments received so far, reused between packets
+        self._rx_fragments = bytearray()
 
         self._ncp_debug = None
         self._reset_uart_reconnect = asyncio.Lock()
@@ -120,6 +135,7 @@ class ZBOSS:
                 for listener in listeners:
                     listener.cancel()
             self._listeners.clear()
+            self._listener_counts.clear()
 
         if self._uart is not None:
             self._uart.close()
@@ -133,42 +149,47 @@ class ZBOSS:
 
         XXX: Can be called multiple times in a single event loop step!
         """
-        if not frame.ll_header.flags & t.LLFlags.LastFrag:
+        if not frame.ll_header.flags_int & _LAST_FRAG_MASK:
             LOGGER.debug("Received fragment: %s", frame)
-            self._rx_fragments.append(frame)
+            self._rx_fragments += frame.hl_packet.serialize_body()
             return
 
         if self._rx_fragments:
-            self._rx_fragments.append(frame)
-            frame = Frame.handle_rx_fragmentation(self._rx_fragments)
-            self._rx_fragments = []
+            self._rx_fragments += frame.hl_packet.serialize_body()
+            frame = Frame.from_hl_body(self._rx_fragments)
+            self._rx_fragments.clear()
 
-        if frame.hl_packet.header not in c.COMMANDS_BY_ID:
+        header = frame.hl_packet.header
+        command_cls = _get_command_cls(header)
+
+        if command_cls is None:
             LOGGER.debug("Received an unknown frame: %s", frame)
             return
 
-        command_cls = c.COMMANDS_BY_ID[frame.hl_packet.header]
-
         command = command_cls.from_frame(frame)
 
         LOGGER.debug("Received command: %s", command)
-        matched = False
-        one_shot_matched = False
+        listeners = self._listeners.get(header)
 
-        for listener in self._listeners[command.header]:
-            if one_shot_matched and isinstance(
-                    listener, OneShotResponseListener):
-                continue
+        if not listeners:
+            self._unhandled_command(command)
+            return False
+
+        matched = False
 
+        for listener in listeners:
             if not listener.resolve(command):
-                LISTENER_LOGGER.debug(f"{command} does not match {listener}")
+                LISTENER_LOGGER.debug(
+                    "%s does not match %s", command, listener
+                )
                 continue
 
             matched = True
-            LISTENER_LOGGER.debug(f"{command} matches {listener}")
+            LISTENER_LOGGER.debug("%s matches %s", command, listener)
 
+            # One-shot listeners are kept last and only one may match
             if isinstance(listener, OneShotResponseListener):
-                one_shot_matched = True
+                break
 
         if not matched:
             self._unhandled_command(command)
@@ -177,7 +198,7 @@ class ZBOSS:
 
     def _unhandled_command(self, command: t.CommandBase):
         """Command not handled by any listener."""
-        LOGGER.debug(f"Command was not handled: {command}")
+        LOGGER.debug("Command was not handled: %s", command)
 
     async def request(
             self, request: t.CommandBase,
@@ -197,19 +218,27 @@ class ZBOSS:
         LOGGER.debug("Sending request: %s", request)
 
         frame = request.to_frame()
-        # If the frame is too long, it needs fragmentation.
-        fragments = frame.handle_tx_fragmentation()
+        # If the frame is too long, it needs fragmentation. Fragments are
+        # built one at a time while sending.
+        fragments = frame.iter_fragments()
+
+        response_future = self.wait_for_response(
+            _partial_response(request.Rsp)
+        )
 
-        response_future = self.wait_for_response(request.Rsp(partial=True))
+        # Only blocking requests are serialized with the lock
+        if request.blocking:
+            async with self._blocking_request_lock:
+                return await self._send_frags(
+                    fragments, response_future, timeout=timeout)
 
-        async with self._conditional_blocking_request_lock(request.blocking):
-            return await self._send_frags(
-                fragments, response_future, timeout=timeout)
+        return await self._send_frags(
+            fragments, response_future, timeout=timeout)
 
     async def _send_frags(self, fragments, response_future, timeout):
         """Send frame fragments to the uart."""
         for frag in fragments:
-            if frag.ll_header.flags.value & t.LLFlags.LastFrag.value:
+            if frag.ll_header.flags_int & _LAST_FRAG_MASK:
                 return await self._send_to_uart(frag, response_future, timeout)
             await self._send_to_uart(frag, None)
 
@@ -225,17 +254,26 @@ class ZBOSS:
                 async with async_timeout.timeout(timeout):
                     return await response_future
         except asyncio.TimeoutError:
-            LOGGER.debug(f"Timeout after {timeout}s: {frame}")
+            LOGGER.debug("Timeout after %ss: %s", timeout, frame)
             raise
 
-    @contextlib.asynccontextmanager
-    async def _conditional_blocking_request_lock(self, blocking):
-        """Use async lock if the request is a blocking request."""
-        if blocking:
-            async with self._blocking_request_lock:
-                yield
-        else:
-            yield
+    def _add_listener(
+            self, header: t.HLCommonHeader,
+            listener: BaseResponseListener) -> None:
+        """Add a listener to the header's list.
+
+        Indication listeners are kept ahead of one-shot listeners so that
+        dispatch can stop at the first one-shot listener that resolves.
+        """
+        listeners = self._listeners.setdefault(header, [])
+
+        if not isinstance(listener, OneShotResponseListener):
+            for index, other in enumerate(listeners):
+                if isinstance(other, OneShotResponseListener):
+                    listeners.insert(index, listener)
+                    return
+
+        listeners.append(listener)
 
     def wait_for_responses(
             self, responses, *, context=False) -> asyncio.Future:
@@ -248,12 +286,14 @@ class ZBOSS:
         LISTENER_LOGGER.debug("Creating one-shot listener %s", listener)
 
         for header in listener.matching_headers():
-            self._listeners[header].append(listener)
+            self._add_listener(header, listener)
+
+        self._listener_counts[type(listener)] += 1
 
         # Remove the listener when the future is done,
         # not only when it gets a result
         listener.future.add_done_callback(
-            lambda _: self.remove_listener(listener))
+            functools.partial(self._remove_done_listener, listener))
 
         if context:
             return listener.future, listener
@@ -276,28 +316,42 @@ class ZBOSS:
 
         LISTENER_LOGGER.debug("Removing listener %s", listener)
 
+        removed = False
+
         for header in listener.matching_headers():
+            listeners = self._listeners.get(header)
+
+            if listeners is None:
+                continue
+
             try:
-                self._listeners[header].remove(listener)
+                listeners.remove(listener)
+                removed = True
             except ValueError:
                 pass
 
-            if not self._listeners[header]:
+            if not listeners:
                 LISTENER_LOGGER.debug(
                     "Cleaning up empty listener list for header %s", header
                 )
                 del self._listeners[header]
 
-        counts = Counter()
+        if removed:
+            self._listener_counts[type(listener)] -= 1
 
-        for listener in itertools.chain.from_iterable(
-                self._listeners.values()):
-            counts[type(listener)] += 1
+        if LISTENER_LOGGER.isEnabledFor(logging.DEBUG):
+            counts = self._listener_counts
+            LISTENER_LOGGER.debug(
+                "There are %d callbacks and %d one-shot listeners remaining",
+                counts[IndicationListener],
+                counts[OneShotResponseListener],
+            )
 
-        LISTENER_LOGGER.debug(
-            f"There are {counts[IndicationListener]} callbacks and"
-            f" {counts[OneShotResponseListener]} one-shot listeners remaining"
-        )
+    def _remove_done_listener(
+            self, listener: BaseResponseListener,
+            future: asyncio.Future) -> None:
+        """Remove a one-shot listener once its future is done."""
+        self.remove_listener(listener)
 
     def register_indication_listeners(
             self, responses, callback) -> IndicationListener:
@@ -307,10 +361,12 @@ class ZBOSS:
         """
         listener = IndicationListener(responses, callback=callback)
 
-        LISTENER_LOGGER.debug(f"Creating callback {listener}")
+        LISTENER_LOGGER.debug("Creating callback %s", listener)
 
         for header in listener.matching_headers():
-            self._listeners[header].append(listener)
+            self._add_listener(header, listener)
+
+        self._listener_counts[type(listener)] += 1
 
         return listener
 
@@ -327,15 +383,11 @@ class ZBOSS:
         res = await self.request(req)
         if res.StatusCode:
             return None
-        version = ['', '', '']
-        for idx, ver in enumerate(
-                [res.FWVersion, res.StackVersion, res.ProtocolVersion]):
-            major = str((ver & 0xFF000000) >> 24)
-            minor = str((ver & 0x00FF0000) >> 16)
-            revision = str((ver & 0x0000FF00) >> 8)
-            commit = str((ver & 0x000000FF))
-            version[idx] = ".".join([major, minor, revision, commit])
-        return tuple(version)
+        # Each version is packed as major.minor.revision.commit bytes
+        return tuple(
+            "{}.{}.{}.{}".format(*ver.to_bytes(4, "big"))
+            for ver in (res.FWVersion, res.StackVersion, res.ProtocolVersion)
+        )
 
     async def reset(
         self,
@@ -1,6 +1,11 @@
 """Module for checksum calculation."""
+import struct
+
 import zigpy_zboss.types as t
 
+# Buffers at least this long are checksummed four bytes per iteration
+SLICE_BY_4_MIN_SIZE = 16
+
 
 class CRC8:
     """Crc8 checksum calculation.
@@ -13,7 +18,8 @@ class CRC8:
     digest_size = 1
     block_size = 1
 
-    _table = [
+    # Stored as bytes so every lookup is a C-level index returning an int
+    _table = bytes([
         0xea, 0xd4, 0x96, 0xa8, 0x12, 0x2c, 0x6e, 0x50, 0x7f, 0x41, 0x03, 0x3d,
         0x87, 0xb9, 0xfb, 0xc5, 0xa5, 0x9b, 0xd9, 0xe7, 0x5d, 0x63, 0x21, 0x1f,
         0x30, 0x0e, 0x4c, 0x72, 0xc8, 0xf6, 0xb4, 0x8a, 0x74, 0x4a, 0x08, 0x36,
@@ -35,7 +41,7 @@ class CRC8:
         0xdb, 0xe5, 0xa7, 0x99, 0x23, 0x1d, 0x5f, 0x61, 0x9f, 0xa1, 0xe3, 0xdd,
         0x67, 0x59, 0x1b, 0x25, 0x0a, 0x34, 0x76, 0x48, 0xf2, 0xcc, 0x8e, 0xb0,
         0xd0, 0xee, 0xac, 0x92, 0x28, 0x16, 0x54, 0x6a, 0x45, 0x7b, 0x39, 0x07,
-        0xbd, 0x83, 0xc1, 0xff]
+        0xbd, 0x83, 0xc1, 0xff])
 
     def __init__(self, initial_string=b'', initial_start=0x00):
         """Create a new crc8 hash instance."""
@@ -73,7 +79,12 @@ class CRC8:
             raise TypeError("Unicode-objects must be encoded before"
                             " hashing")
         elif not isinstance(bytes_, (bytes, bytearray)):
-            raise TypeError("object supporting the buffer API required")
+            # Checksum other buffers, like memoryview slices, without a copy
+            try:
+                bytes_ = memoryview(bytes_).cast("B")
+            except TypeError:
+                raise TypeError(
+                    "object supporting the buffer API required") from None
         table = self._table
         _sum = self._sum
         for byte in bytes_:
@@ -173,10 +184,27 @@ class CRC16:
             raise TypeError("Unicode-objects must be encoded before"
                             " hashing")
         elif not isinstance(bytes_, (bytes, bytearray)):
-            raise TypeError("object supporting the buffer API required")
+            # Checksum other buffers, like memoryview slices, without a copy
+            try:
+                bytes_ = memoryview(bytes_).cast("B")
+            except TypeError:
+                raise TypeError(
+                    "object supporting the buffer API required") from None
         table = self._table
         _sum = self._sum
-        for byte in bytes_:
+        tail = bytes_
+        if len(bytes_) >= SLICE_BY_4_MIN_SIZE:
+            # Slice-by-4: fold the low two bytes into the register and look
+            # the next two up in tables that are pre-shifted by 2 and 3 bytes
+            table1, table2, table3 = self._slice_tables
+            view = memoryview(bytes_)
+            split = len(view) & ~3
+            for word, byte2, byte3 in struct.iter_unpack("<HBB", view[:split]):
+                _sum ^= word
+                _sum = (table3[_sum & 0x00FF] ^ table2[_sum >> 8]
+                        ^ table1[byte2] ^ table[byte3])
+            tail = view[split:]
+        for byte in tail:
             _sum = (_sum >> 8) ^ table[(_sum ^ byte) & 0x00FF]
         self._sum = _sum
 
@@ -189,3 +217,16 @@ class CRC16:
         crc = CRC16()
         crc._sum = self._sum
         return crc
+
+
+def _build_slice_tables(table):
+    """Derive the tables that advance a CRC16 register by 1, 2 and 3 bytes."""
+    tables = []
+    previous = table
+    for _ in range(3):
+        previous = [(crc >> 8) ^ table[crc & 0x00FF] for crc in previous]
+        tables.append(previous)
+    return tuple(tables)
+
+
+CRC16._slice_tables = _build_slice_tables(CRC16._table)
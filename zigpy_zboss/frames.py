@@ -2,6 +2,7 @@
 from __future__ import annotations
 
 import dataclasses
+import struct
 
 import zigpy_zboss.types as t
 from zigpy_zboss.checksum import CRC8, CRC16
@@ -9,6 +10,15 @@ from zigpy_zboss.exceptions import InvalidFrame
 
 ZBNCP_LL_BODY_SIZE_MAX = 247  # Check zbncp_ll_pkt.h in ZBOSS NCP host src
 
+# Signature, size, frame type, flags and CRC8 of a serialized LLHeader
+LL_HEADER_STRUCT = struct.Struct("<HHBBB")
+LL_HEADER_MASKS = (0xFFFF, 0xFFFF, 0xFF, 0xFF, 0xFF)
+
+
+def count_fragments(ll_body_size: int) -> int:
+    """Return the number of fragments needed to send a HL packet body."""
+    return -(-ll_body_size // ZBNCP_LL_BODY_SIZE_MAX)
+
 
 class LLHeader(t.uint56_t):
     """Low Level Header class."""
@@ -24,23 +34,18 @@ class LLHeader(t.uint56_t):
             crc8=None) -> "LLHeader":
         """Create a new low level header object."""
         instance = super().__new__(cls, value)
+        fields = (sign, size, frame_type, flags, crc8)
 
-        if sign is not None:
-            instance = instance.with_signature(sign)
-
-        if size is not None:
-            instance = instance.with_size(size)
-
-        if frame_type is not None:
-            instance = instance.with_type(frame_type)
+        if all(field is None for field in fields):
+            return instance
 
-        if flags is not None:
-            instance = instance.with_flags(flags)
-
-        if crc8 is not None:
-            instance = instance.with_crc8(crc8)
-
-        return instance
+        # Pack all the given fields at once instead of one with_*() each
+        current = LL_HEADER_STRUCT.unpack(instance.serialize())
+        packed = LL_HEADER_STRUCT.pack(*(
+            old if new is None else new & mask
+            for old, new, mask in zip(current, fields, LL_HEADER_MASKS)
+        ))
+        return super().__new__(cls, int.from_bytes(packed, "little"))
 
     @property
     def signature(self) -> t.uint16_t:
@@ -62,11 +67,20 @@ class LLHeader(t.uint56_t):
         """Return 8 bit flag enum."""
         return t.LLFlags((self >> 40) & 0xFF)
 
+    @property
+    def flags_int(self) -> int:
+        """Return the 8 bit flags as a plain int, without building an enum."""
+        return (self >> 40) & 0xFF
+
     @property
     def crc8(self) -> t.uint8_t:
         """Return the calculated CRC8 starting from size."""
         return t.uint8_t(self >> 48)
 
+    def calculate_crc8(self) -> t.uint8_t:
+        """Return the CRC8 of the size, frame type and flags fields."""
+        return CRC8(((self >> 16) & 0xFFFFFFFF).to_bytes(4, "little")).digest()
+
     def with_signature(self, value) -> "LLHeader":
         """Set the frame signature."""
         return type(self)(self & 0xFFFFFFFFFF0000 | (value & 0xFFFF))
@@ -102,12 +116,16 @@ class LLHeader(t.uint56_t):
     __repr__ = __str__
 
 
-@dataclasses.dataclass(frozen=True)
+@dataclasses.dataclass(frozen=True, slots=True)
 class HLPacket:
     """High level part of the frame."""
 
     header: t.HLCommonHeader
     data: t.Bytes
+    # Serialized packet, filled in on first use
+    _serialized: bytes | None = dataclasses.field(
+        default=None, init=False, repr=False, compare=False
+    )
 
     def __post_init__(self) -> None:
         """Magic method."""
@@ -137,17 +155,25 @@ class HLPacket:
         header, payload = t.HLCommonHeader.deserialize(data)
         return cls(header, payload)
 
-    def serialize(self) -> bytes:
-        """Serialize frame and calculate CRC."""
+    def serialize_body(self) -> bytes:
+        """Serialize the header and data, without the CRC."""
         serialized_data = self.data.serialize()
         if self.header:
-            serialized_header = self.header.serialize()
-            serialized_hl_packet = serialized_header + serialized_data
-        else:
-            serialized_hl_packet = serialized_data
+            return self.header.serialize() + serialized_data
+        return serialized_data
+
+    def serialize(self) -> bytes:
+        """Serialize frame and calculate CRC."""
+        if self._serialized is not None:
+            return self._serialized
 
+        # The packet is frozen, so the CRC is only ever computed once
+        serialized_hl_packet = self.serialize_body()
         hl_checksum = CRC16(serialized_hl_packet).digest()
-        return hl_checksum.serialize() + serialized_hl_packet
+        serialized = hl_checksum.serialize() + serialized_hl_packet
+        object.__setattr__(self, "_serialized", serialized)
+
+        return serialized
 
 
 @dataclasses.dataclass
@@ -161,33 +187,45 @@ class Frame:
 
     @classmethod
     def deserialize(cls, data: bytes) -> tuple[Frame, bytes]:
-        """Deserialize frame and sanity check."""
-        ll_header, data = LLHeader.deserialize(data)
-        if ll_header.signature != cls.signature:
+        """Deserialize frame and sanity check.
+
+        Only the payload is copied: the remaining data is returned as a slice
+        of `data`, which is zero-copy if `data` is a memoryview.
+        """
+        if len(data) < LL_HEADER_STRUCT.size:
+            raise ValueError(
+                f"Data is too short to contain {LL_HEADER_STRUCT.size} bytes"
+            )
+
+        # Read all the header fields at once instead of through the properties
+        signature, size, _, flags, crc8 = LL_HEADER_STRUCT.unpack_from(data)
+
+        # Reject garbage before building anything from it
+        if signature != cls.signature:
             raise InvalidFrame(
                 "Expected frame to start with Signature "
-                f"0x{cls.signature:04X}, got 0x{ll_header.signature:04X}"
+                f"0x{cls.signature:04X}, got 0x{signature:04X}"
             )
 
-        ll_checksum = CRC8(ll_header.serialize()[2:6]).digest()
-        if ll_checksum != ll_header.crc8:
+        ll_header, _ = LLHeader.deserialize(data[:LL_HEADER_STRUCT.size])
+        ll_checksum = ll_header.calculate_crc8()
+        if ll_checksum != crc8:
             raise InvalidFrame(
                 f"Invalid frame checksum for data {ll_header}: "
-                f"expected 0x{ll_header.crc8:02X}, got 0x{ll_checksum:02X}"
+                f"expected 0x{crc8:02X}, got 0x{ll_checksum:02X}"
             )
-        flags = ll_header.flags
 
         if flags & t.LLFlags.isACK:
-            return cls(ll_header, None), data
+            return cls(ll_header, None), data[LL_HEADER_STRUCT.size:]
 
-        length = ll_header.size - 5
-        payload, data = data[:length], data[length:]
+        end = size + 2
+        payload = bytes(data[LL_HEADER_STRUCT.size:end])
         if flags & t.LLFlags.FirstFrag:
             hl_packet = HLPacket.deserialize(payload)
-            return cls(ll_header, hl_packet), data
+            return cls(ll_header, hl_packet), data[end:]
 
         hl_packet = HLPacket(None, payload)
-        return cls(ll_header, hl_packet), data
+        return cls(ll_header, hl_packet), data[end:]
 
     @classmethod
     def ack(cls, ack_seq, retransmit=False):
@@ -197,40 +235,48 @@ class Frame:
         if retransmit:
             flag |= t.LLFlags.Retransmit
 
-        ll_header = (
-            LLHeader()
-            .with_signature(cls.signature)
-            .with_size(5)
-            .with_type(t.TYPE_ZBOSS_NCP_API_HL)
-            .with_flags(flag)
+        ll_header = LLHeader(
+            sign=cls.signature,
+            size=5,
+            frame_type=t.TYPE_ZBOSS_NCP_API_HL,
+            flags=flag
         )
-        crc = CRC8(ll_header.serialize()[2:6]).digest()
-        ll_header = ll_header.with_crc8(crc)
+        ll_header = ll_header.with_crc8(ll_header.calculate_crc8())
         return cls(ll_header, None)
 
     @classmethod
     def handle_rx_fragmentation(cls, fragments):
         """Return a frame containing merged data from fragments."""
-        data = bytes()
-        for frag in fragments:
-            data += frag.hl_packet.serialize()[2:]
-        # Concatenate new CRC.
-        data = t.uint16_t(CRC16(data).digest()).serialize() + data
-        ll_header = (
-            LLHeader()
-            .with_signature(Frame.signature)
-            .with_size(len(data) + 5)
-            .with_type(t.TYPE_ZBOSS_NCP_API_HL)
-            .with_flags(t.LLFlags.FirstFrag | t.LLFlags.LastFrag)
+        # Join the fragments in one go, without computing the CRC16 of each
+        # fragment only to strip it again.
+        return cls.from_hl_body(
+            b"".join([frag.hl_packet.serialize_body() for frag in fragments])
+        )
+
+    @classmethod
+    def from_hl_body(cls, body) -> Frame:
+        """Return an unfragmented frame for a HL header and data buffer.
+
+        The buffer is copied, so callers are free to reuse it afterwards.
+        """
+        header, payload = t.HLCommonHeader.deserialize(bytes(body))
+        hl_packet = HLPacket(header, payload)
+        ll_header = LLHeader(
+            sign=Frame.signature,
+            # LL header without the signature, HL checksum and body
+            size=len(body) + 7,
+            frame_type=t.TYPE_ZBOSS_NCP_API_HL,
+            flags=t.LLFlags.FirstFrag | t.LLFlags.LastFrag
         )
-        hl_packet = HLPacket.deserialize(data)
         return cls(ll_header, hl_packet)
 
     def serialize(self) -> bytes:
         """Serialize the frame."""
         if self.hl_packet is None:
             return self.ll_header.serialize()
-        return self.ll_header.serialize() + self.hl_packet.serialize()
+        return b"".join(
+            [self.ll_header.serialize(), self.hl_packet.serialize()]
+        )
 
     @property
     def is_ack(self) -> bool:
@@ -249,72 +295,70 @@ class Frame:
 
     def count_fragments(self):
         """Count the number of frame fragments."""
-        ll_body_size = len(self.hl_packet.serialize()[2:])
-        return int(-(-ll_body_size // ZBNCP_LL_BODY_SIZE_MAX))
+        return count_fragments(len(self.hl_packet.serialize_body()))
 
     def handle_tx_fragmentation(self):
         """Handle frame fragmentation."""
-        if not self.fragmentation_needed:
-            return [self]
+        return list(self.iter_fragments())
+
+    def iter_fragments(self):
+        """Yield the fragments of the frame as they are built.
 
-        # Store initial hl packet data without crc.
-        serialized_hl_packet = self.hl_packet.serialize()[2:]
+        This lets a fragment be sent while the next one is prepared, without
+        holding all of them in memory alongside the original frame.
+        """
+        # Store initial hl packet data without crc. Fragments are sliced from
+        # a view so the payload is only copied once, into each fragment.
+        serialized_hl_packet = memoryview(self.hl_packet.serialize_body())
         total_size = len(serialized_hl_packet)
+
+        if count_fragments(total_size) <= 1:
+            yield self
+            return
+
         first_frag_size = \
             total_size % ZBNCP_LL_BODY_SIZE_MAX or ZBNCP_LL_BODY_SIZE_MAX
 
-        fragments = []
-        frag_idxs = range(first_frag_size, total_size, ZBNCP_LL_BODY_SIZE_MAX)
-
-        for frag_nbr in range(1, self.count_fragments() + 1):
-            if frag_nbr == 1:
-                frag = self._create_first_frag(first_frag_size)
-            elif frag_nbr == self.count_fragments():
-                frag = self._create_last_frag(serialized_hl_packet)
-            else:
-                idx = frag_idxs[frag_nbr - 2]
-                frag = self._create_frag(idx, serialized_hl_packet)
-            fragments.append(frag)
-        return fragments
-
-    def _create_first_frag(self, frag_size):
+        # Fragments only differ by their size and flags. Sequence flag and
+        # CRC8 are set later before sending frame over uart.
+        ll_header = LLHeader(
+            sign=Frame.signature, frame_type=t.TYPE_ZBOSS_NCP_API_HL
+        )
+        full_ll_header = ll_header.with_size(ZBNCP_LL_BODY_SIZE_MAX + 7)
+
+        yield self._create_first_frag(ll_header, first_frag_size)
+
+        frag_idxs = range(
+            first_frag_size,
+            total_size - ZBNCP_LL_BODY_SIZE_MAX,
+            ZBNCP_LL_BODY_SIZE_MAX
+        )
+        for idx in frag_idxs:
+            yield self._create_frag(full_ll_header, idx, serialized_hl_packet)
+
+        yield self._create_last_frag(full_ll_header, serialized_hl_packet)
+
+    def _create_first_frag(self, ll_header, frag_size):
         """Create the first fragment of a frame."""
-        # Sequence flag and CRC8 are set later before sending frame over uart.
-        ll_header = (
-            LLHeader()
-            .with_signature(Frame.signature)
-            .with_size(frag_size + 7)
-            .with_type(t.TYPE_ZBOSS_NCP_API_HL)
-            .with_flags(t.LLFlags.FirstFrag)
+        ll_header = LLHeader(
+            ll_header, size=frag_size + 7, flags=t.LLFlags.FirstFrag
         )
         # CRC16 is automatically added when serialize() is called.
         hl_packet = HLPacket(
-            self.hl_packet.header, self.hl_packet.data[:(frag_size - 4)])
+            self.hl_packet.header,
+            memoryview(self.hl_packet.data)[:(frag_size - 4)]
+        )
         return Frame(ll_header, hl_packet)
 
-    def _create_last_frag(self, serialized_hl_packet):
+    def _create_last_frag(self, ll_header, serialized_hl_packet):
         """Create the last fragment of a frame."""
-        # Sequence flag and CRC8 are set later before sending frame over uart.
-        ll_header = (
-            LLHeader()
-            .with_signature(Frame.signature)
-            .with_size(ZBNCP_LL_BODY_SIZE_MAX + 7)
-            .with_type(t.TYPE_ZBOSS_NCP_API_HL)
-            .with_flags(t.LLFlags.LastFrag)
-        )
+        ll_header = ll_header.with_flags(t.LLFlags.LastFrag)
         hl_packet = HLPacket(
             None, serialized_hl_packet[-ZBNCP_LL_BODY_SIZE_MAX:])
         return Frame(ll_header, hl_packet)
 
-    def _create_frag(self, idx, serialized_hl_packet):
+    def _create_frag(self, ll_header, idx, serialized_hl_packet):
         """Create a fragment that is not the first nor the last."""
-        # Sequence flag and CRC8 are set later before sending frame over uart.
-        ll_header = (
-            LLHeader()
-            .with_signature(Frame.signature)
-            .with_size(ZBNCP_LL_BODY_SIZE_MAX + 7)
-            .with_type(t.TYPE_ZBOSS_NCP_API_HL)
-        )
         hl_packet = HLPacket(
             None, serialized_hl_packet[idx:(idx + ZBNCP_LL_BODY_SIZE_MAX)])
         return Frame(ll_header, hl_packet)
@@ -1,6 +1,8 @@
 """Module defining basic types."""
 from __future__ import annotations
 
+import enum
+import struct
 import typing
 
 from zigpy.types import enum_factory, int8s, uint8_t  # noqa: F401
@@ -8,8 +10,6 @@ from zigpy.types import enum_factory, int8s, uint8_t  # noqa: F401
 from zigpy_zboss.types.cstruct import CStruct
 
 if typing.TYPE_CHECKING:
-    import enum
-
     class enum8(int, enum.Enum):
         """Enum with 8 bits value."""
 
@@ -62,7 +62,7 @@ class Bytes(bytes):
         """Redefine Bytes representation."""
         # Reading byte sequences like \x200\x21 is extremely annoying
         # compared to \x20\x30\x21
-        escaped = "".join(f":{b:02X}" for b in self)[1:]
+        escaped = self.hex(":").upper()
 
         return f"b'{escaped}'"
 
@@ -94,10 +94,46 @@ class LongBytes(ShortBytes):
     _header = uint16_t
 
 
+# struct formats of fixed size integers, keyed by (byte size, signed)
+_INT_FORMATS = {
+    (1, False): "B",
+    (1, True): "b",
+    (2, False): "H",
+    (2, True): "h",
+    (4, False): "I",
+    (4, True): "i",
+    (8, False): "Q",
+    (8, True): "q",
+}
+
+
+def _int_item_format(item_type) -> str | None:
+    """Return the struct format of plain fixed size integer item types."""
+    if not issubclass(item_type, int) or issubclass(item_type, enum.Enum):
+        return None
+
+    size = getattr(item_type, "_size", None)
+    signed = getattr(item_type, "_signed", None)
+
+    # Skip big endian and partial byte integers
+    if getattr(item_type, "_byteorder", "little") != "little":
+        return None
+    elif size is None or getattr(item_type, "_bits", None) != 8 * size:
+        return None
+
+    return _INT_FORMATS.get((size, signed))
+
+
 class BaseListType(list):
     """Class defining the list type base."""
 
     _item_type = None
+    _item_format = None
+
+    @classmethod
+    def _set_item_type(cls, item_type) -> None:
+        cls._item_type = item_type
+        cls._item_format = _int_item_format(item_type)
 
     @classmethod
     def _serialize_item(cls, item, *, align):
@@ -116,6 +152,26 @@ class BaseListType(list):
         else:
             return cls._item_type.deserialize(data)
 
+    @classmethod
+    def _deserialize_items(cls, data, count, *, align):
+        if cls._item_format is None:
+            items = []
+            for _ in range(count):
+                item, data = cls._deserialize_item(data, align=align)
+                items.append(item)
+            return items, data
+
+        # Integer items are all unpacked at once
+        fmt = f"<{count}{cls._item_format}"
+        size = struct.calcsize(fmt)
+        if len(data) < size:
+            raise ValueError(
+                f"Data is too short to contain {count} {cls._item_type}")
+
+        item_type = cls._item_type
+        items = [item_type(v) for v in struct.unpack_from(fmt, data)]
+        return items, data[size:]
+
 
 class LVList(BaseListType):
     """Class representing a list of type with a length header."""
@@ -125,7 +181,7 @@ class LVList(BaseListType):
     def __init_subclass__(cls, *, item_type, length_type) -> None:
         """Set class parameter when the class is used as parent."""
         super().__init_subclass__()
-        cls._item_type = item_type
+        cls._set_item_type(item_type)
         cls._header = length_type
 
     def serialize(self, *, align=False) -> bytes:
@@ -139,11 +195,8 @@ class LVList(BaseListType):
     def deserialize(cls, data: bytes, *, align=False) -> tuple[LVList, bytes]:
         """Deserialize object."""
         length, data = cls._header.deserialize(data)
-        r = cls()
-        for i in range(length):
-            item, data = cls._deserialize_item(data, align=align)
-            r.append(item)
-        return r, data
+        items, data = cls._deserialize_items(data, length, align=align)
+        return cls(items), data
 
 
 class FixedList(BaseListType):
@@ -154,7 +207,7 @@ class FixedList(BaseListType):
     def __init_subclass__(cls, *, item_type, length) -> None:
         """Set the length when the class is used as parent."""
         super().__init_subclass__()
-        cls._item_type = item_type
+        cls._set_item_type(item_type)
         cls._length = length
 
     def serialize(self, *, align=False) -> bytes:
@@ -173,11 +226,8 @@ class FixedList(BaseListType):
     def deserialize(
             cls, data: bytes, *, align=False) -> tuple[FixedList, bytes]:
         """Deserialize object."""
-        r = cls()
-        for i in range(cls._length):
-            item, data = cls._deserialize_item(data, align=align)
-            r.append(item)
-        return r, data
+        items, data = cls._deserialize_items(data, cls._length, align=align)
+        return cls(items), data
 
 
 class CompleteList(BaseListType):
@@ -186,7 +236,7 @@ class CompleteList(BaseListType):
     def __init_subclass__(cls, *, item_type) -> None:
         """Set class parameter when the class is used as parent."""
         super().__init_subclass__()
-        cls._item_type = item_type
+        cls._set_item_type(item_type)
 
     def serialize(self, *, align=False) -> bytes:
         """Serialize object."""
@@ -196,6 +246,13 @@ class CompleteList(BaseListType):
     def deserialize(
             cls, data: bytes, *, align=False) -> tuple[CompleteList, bytes]:
         """Deserialize object."""
+        if cls._item_format is not None:
+            count, extra = divmod(len(data), struct.calcsize(cls._item_format))
+            # Trailing partial items are left to the per-item path to reject
+            if not extra:
+                items, data = cls._deserialize_items(data, count, align=align)
+                return cls(items), data
+
         r = cls()
         while data:
             item, data = cls._deserialize_item(data, align=align)
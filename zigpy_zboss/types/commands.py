@@ -3,7 +3,9 @@ from __future__ import annotations
 
 import dataclasses
 import enum
+import functools
 import logging
+import struct
 
 import zigpy.zdo.types
 
@@ -174,6 +176,10 @@ class StatusCodeCBKE(t.enum8):
     NO_KE_EP = 7
 
 
+# Serialized form of every possible single byte value
+_BYTE_VALUES = tuple(bytes([value]) for value in range(256))
+
+
 class LLFlags(t.bitmap8):
     """Flags in low level header."""
 
@@ -184,6 +190,10 @@ class LLFlags(t.bitmap8):
     FirstFrag = 0x40
     LastFrag = 0x80
 
+    def serialize(self) -> bytes:
+        """Serialize the flags with a table lookup."""
+        return _BYTE_VALUES[self]
+
 
 class HLCommonHeader(t.uint32_t):
     """High Level Common Header class."""
@@ -205,6 +215,16 @@ class HLCommonHeader(t.uint32_t):
 
         return instance
 
+    @classmethod
+    @functools.lru_cache(maxsize=1024)
+    def get(cls, version, type, id) -> "HLCommonHeader":
+        """Return a shared header instance with the given fields.
+
+        Headers are immutable integers, so the few distinct ones used by
+        commands can be built once and reused.
+        """
+        return cls(version=version, type=type, id=id)
+
     @property
     def version(self) -> t.uint8_t:
         """Return protocol version."""
@@ -245,7 +265,7 @@ class HLCommonHeader(t.uint32_t):
     __repr__ = __str__
 
 
-@dataclasses.dataclass(frozen=True)
+@dataclasses.dataclass(frozen=True, slots=True)
 class CommandDef:
     """Class used to define a command."""
 
@@ -288,15 +308,15 @@ class CommandsMeta(type):
                 "Ind": None,
             }
 
-            header = (
-                HLCommonHeader()
-                .with_id(definition.command_id)
-                .with_type(definition.control_type)
+            header = HLCommonHeader.get(
+                0, definition.control_type, definition.command_id
             )
 
             if definition.req_schema is not None:
                 req_header = header
-                rsp_header = req_header.with_type(ControlType.RSP)
+                rsp_header = HLCommonHeader.get(
+                    0, ControlType.RSP, definition.command_id
+                )
 
                 class Req(
                     CommandBase, header=req_header,
@@ -371,19 +391,42 @@ class CommandBase:
         cls.schema = schema
         cls.blocking = blocking
 
+        # Resolved once here instead of with `issubclass` for every frame
+        cls._cstruct_flags = tuple(
+            issubclass(param.type, t.CStruct) for param in schema
+        )
+
+        # Schemas made only of required plain integers are packed at once
+        formats = [
+            None if param.optional else t._int_item_format(param.type)
+            for param in schema
+        ]
+        if schema and None not in formats:
+            cls._struct = struct.Struct("<" + "".join(formats))
+        else:
+            cls._struct = None
+
+        # Parameter name lookups used to validate every new instance
+        cls._param_names = frozenset(param.name for param in schema)
+        cls._optional_params = [
+            param.name for param in schema if param.optional
+        ]
+        cls._required_params = cls._param_names.difference(
+            cls._optional_params
+        )
+
     def __init__(self, *, partial=False, **params):
         """Initialize object."""
         super().__setattr__("_partial", partial)
         super().__setattr__("_bound_params", {})
 
-        all_params = [p.name for p in self.schema]
-        optional_params = [p.name for p in self.schema if p.optional]
-        given_params = set(params.keys())
+        all_params = self._param_names
+        optional_params = self._optional_params
+        given_params = params.keys()
         given_optional = [p for p in params.keys() if p in optional_params]
 
-        unknown_params = given_params - set(all_params)
-        missing_params = (
-            set(all_params) - set(optional_params)) - given_params
+        unknown_params = given_params - all_params
+        missing_params = self._required_params - given_params
 
         if unknown_params:
             raise KeyError(
@@ -460,26 +503,33 @@ class CommandBase:
 
         from zigpy_zboss.frames import Frame, HLPacket, LLHeader
 
-        chunks = []
+        if self._struct is not None:
+            data = self._struct.pack(
+                *(value for _, value in self._bound_params.values())
+            )
+        else:
+            chunks = []
 
-        for param, value in self._bound_params.values():
-            if value is None:
-                continue
+            for (param, value), is_cstruct in zip(
+                    self._bound_params.values(), self._cstruct_flags):
+                if value is None:
+                    continue
 
-            if issubclass(param.type, t.CStruct):
-                chunks.append(value.serialize(align=align))
-            else:
-                chunks.append(value.serialize())
+                if is_cstruct:
+                    chunks.append(value.serialize(align=align))
+                else:
+                    chunks.append(value.serialize())
+
+            data = b"".join(chunks)
 
-        hl_packet = HLPacket(self.header, b"".join(chunks))
+        hl_packet = HLPacket(self.header, data)
 
         # Sequence flag and CRC8 are set later before sending frame over uart.
-        ll_header = (
-            LLHeader()
-            .with_signature(Frame.signature)
-            .with_size(hl_packet.length + 5)
-            .with_type(TYPE_ZBOSS_NCP_API_HL)
-            .with_flags(LLFlags.LastFrag | LLFlags.FirstFrag)
+        ll_header = LLHeader(
+            sign=Frame.signature,
+            size=hl_packet.length + 5,
+            frame_type=TYPE_ZBOSS_NCP_API_HL,
+            flags=LLFlags.LastFrag | LLFlags.FirstFrag
         )
 
         return Frame(ll_header, hl_packet)
@@ -494,11 +544,19 @@ class CommandBase:
             )
 
         data = frame.hl_packet.data
+
+        if cls._struct is not None and len(data) == cls._struct.size:
+            return cls._from_deserialized({
+                param.name: param.type(value)
+                for param, value in zip(
+                    cls.schema, cls._struct.unpack(data))
+            })
+
         params = {}
 
-        for param in cls.schema:
+        for param, is_cstruct in zip(cls.schema, cls._cstruct_flags):
             try:
-                if issubclass(param.type, t.CStruct):
+                if is_cstruct:
                     params[param.name], data = param.type.deserialize(
                         data, align=align)
                 else:
@@ -530,7 +588,23 @@ class CommandBase:
                 f"Frame {frame} contains trailing data after parsing: {data}"
             )
 
-        return cls(**params)
+        return cls._from_deserialized(params)
+
+    @classmethod
+    def _from_deserialized(cls, params) -> "CommandBase":
+        """Return a command from parameters parsed by `from_frame`.
+
+        Every value was just deserialized as its schema type and optional
+        parameters can only be missing at the end, so the coercion and
+        re-serialization checks of `__init__` are skipped.
+        """
+        command = cls.__new__(cls)
+        object.__setattr__(command, "_partial", False)
+        object.__setattr__(command, "_bound_params", {
+            param.name: (param, params.get(param.name))
+            for param in cls.schema
+        })
+        return command
 
     def matches(self, other: "CommandBase") -> bool:
         """Match parameters and values with other CommandBase."""
@@ -564,13 +638,12 @@ class CommandBase:
         params = tuple(self._bound_params.items())
         return hash((type(self), self.header, self.schema, params))
 
-    def __getattribute__(self, key):
-        """Try to return the attribute of the command."""
-        try:
-            return object.__getattribute__(self, key)
-        except AttributeError:
-            pass
+    def __getattr__(self, key):
+        """Try to return a bound parameter of the command.
 
+        Only called when normal lookup fails, so class attributes like
+        `header`, `schema` and `blocking` are read without going through here.
+        """
         try:
             param, value = object.__getattribute__(self, "_bound_params")[key]
             return value
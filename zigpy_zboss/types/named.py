@@ -32,7 +32,7 @@ class ChannelEntry(Struct):
     channel_mask: Channels
 
 
-@dataclasses.dataclass(frozen=True)
+@dataclasses.dataclass(frozen=True, slots=True)
 class Param:
     """Schema parameter."""
 
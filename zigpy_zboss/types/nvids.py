@@ -48,6 +48,10 @@ class NVRAMStruct(t.Struct):
     @classmethod
     def get_byte_size(cls):
         """Return the sum of the byte size of the fields in the struct."""
+        # The fields of a struct are fixed, so only compute this once per class
+        if "_byte_size" in cls.__dict__:
+            return cls._byte_size
+
         # Since some types are a list of basic types, they use _length
         # attribute instead of the _size attribute (e.g t.EUI64).
         size = 0
@@ -56,6 +60,8 @@ class NVRAMStruct(t.Struct):
                 size += structfield.type._size
             except AttributeError:
                 size += structfield.type._length
+
+        cls._byte_size = size
         return size
 
 
@@ -92,11 +98,15 @@ class DSNwkAddrMap(
             cls, data: bytes, *, align=False) -> tuple[basic.LVList, bytes]:
         """Deserialize object."""
         header, data = cls._header.deserialize(data)
-        r = cls()
-        for _ in range(header.entry_count):
-            item, data = cls._deserialize_item(data, align=align)
-            r.append(item)
-        return r, data
+        # Records have a fixed size: parse each one from its own slice rather
+        # than re-slicing the whole remaining buffer after every record
+        record_size = cls._item_type.get_byte_size()
+        end = header.entry_count * record_size
+        r = cls(
+            cls._deserialize_item(data[i:i + record_size], align=align)[0]
+            for i in range(0, end, record_size)
+        )
+        return r, data[end:]
 
     def serialize(self, *, align=False) -> bytes:
         """Serialize object."""
@@ -137,8 +147,8 @@ class DSApsSecureKeys(
         length, data = cls._header.deserialize(data)
         r = cls()
         data = data[4:]  # Dropping the 4 first bytes from the list
-        entry_cnt = (length - 4) / ApsSecureEntry.get_byte_size()
-        for _ in range(int(entry_cnt)):
+        entry_cnt = (length - 4) // ApsSecureEntry.get_byte_size()
+        for _ in range(entry_cnt):
             item, data = cls._deserialize_item(data, align=align)
             r.append(item)
         return r, data
@@ -8,9 +8,8 @@ import zigpy.serial
 
 import zigpy_zboss.config as conf
 from zigpy_zboss import types as t
-from zigpy_zboss.checksum import CRC8
 from zigpy_zboss.exceptions import InvalidFrame
-from zigpy_zboss.frames import Frame
+from zigpy_zboss.frames import LL_HEADER_STRUCT, Frame
 from zigpy_zboss.logger import SERIAL_LOGGER
 
 LOGGER = logging.getLogger(__name__)
@@ -18,6 +17,7 @@ ACK_TIMEOUT = 1
 SEND_RETRIES = 2
 STARTUP_TIMEOUT = 5
 RECONNECT_TIMEOUT = 10
+SIGNATURE = Frame.signature.serialize()
 
 
 class BufferTooShort(Exception):
@@ -138,8 +138,9 @@ class ZbossNcpProtocol(asyncio.Protocol):
 
     def _ll_checksum(self, frame):
         """Return frame with new crc8 checksum calculation."""
-        crc = CRC8(frame.ll_header.serialize()[2:6]).digest()
-        frame.ll_header = frame.ll_header.with_crc8(crc)
+        frame.ll_header = frame.ll_header.with_crc8(
+            frame.ll_header.calculate_crc8()
+        )
         return frame
 
     def data_received(self, data: bytes) -> None:
@@ -182,8 +183,7 @@ class ZbossNcpProtocol(asyncio.Protocol):
             except InvalidFrame:
                 # If the buffer contains invalid data,
                 # drop it until we find the signature
-                signature_idx = self._buffer.find(
-                    Frame.signature.serialize(), 1)
+                signature_idx = self._buffer.find(SIGNATURE, 1)
 
                 if signature_idx < 0:
                     # If we don't have a signature in the buffer,
@@ -195,29 +195,38 @@ class ZbossNcpProtocol(asyncio.Protocol):
     def _extract_frame(self) -> Frame:
         """Extract a single frame from the buffer."""
         # The shortest possible frame is 7 bytes long
-        if len(self._buffer) < 7:
+        if len(self._buffer) < LL_HEADER_STRUCT.size:
             raise BufferTooShort()
 
+        # Everything the framer needs to know is in the LL header
+        signature, length, frame_type, _, _ = LL_HEADER_STRUCT.unpack_from(
+            self._buffer
+        )
+
         # The buffer must start with a SoF
-        if self._buffer[0:2] != Frame.signature.serialize():
+        if signature != Frame.signature:
             raise InvalidFrame()
 
-        length, _ = t.uint16_t.deserialize(self._buffer[2:4])
+        # A frame can't be shorter than its own LL header
+        if length + 2 < LL_HEADER_STRUCT.size:
+            raise InvalidFrame()
 
         # Don't bother deserializing anything if the packet is too short
         if len(self._buffer) < length + 2:
             raise BufferTooShort()
 
         # Check that the packet type is ZBOSS NCP API HL.
-        if self._buffer[4] != t.TYPE_ZBOSS_NCP_API_HL:
+        if frame_type != t.TYPE_ZBOSS_NCP_API_HL:
             raise InvalidFrame()
 
         # At this point we should have a complete frame
-        # If not, deserialization will fail and the error will propapate up
-        frame, rest = Frame.deserialize(self._buffer)
+        # If not, deserialization will fail and the error will propapate up.
+        # Only hand over the frame itself so the rest of the buffer isn't
+        # copied along with it.
+        frame, _ = Frame.deserialize(self._buffer[: length + 2])
 
         # If we get this far then we have a valid frame. Update the buffer.
-        del self._buffer[: len(self._buffer) - len(rest)]
+        del self._buffer[: length + 2]
 
         return frame
 
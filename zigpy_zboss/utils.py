@@ -2,6 +2,7 @@
 from __future__ import annotations
 
 import asyncio
+import collections
 import dataclasses
 import logging
 import typing
@@ -24,9 +25,17 @@ def deduplicate_commands(
     # relationship between two commands as a partial order.
     maximal_commands = []
 
+    # Commands of different types never match each other, so each command is
+    # only compared against the maximal commands of its own type
+    indices_by_type = collections.defaultdict(list)
+
     # Command matching as a relation forms a partially ordered set.
     for command in commands:
-        for index, other_command in enumerate(maximal_commands):
+        indices = indices_by_type[type(command)]
+
+        for index in indices:
+            other_command = maximal_commands[index]
+
             if other_command.matches(command):
                 # If the other command matches us, we are redundant
                 break
@@ -34,11 +43,9 @@ def deduplicate_commands(
                 # If we match another command, we replace it
                 maximal_commands[index] = command
                 break
-            else:
-                # Otherwise, we keep looking
-                continue  # pragma: no cover
         else:
             # If we matched nothing and nothing matched us, we extend the list
+            indices.append(len(maximal_commands))
             maximal_commands.append(command)
 
     # The start of each chain is the maximal element
@@ -61,10 +68,15 @@ class BaseResponseListener:
 
         # We're frozen so __setattr__ is disallowed
         object.__setattr__(self, "matching_commands", commands)
-
-    def matching_headers(self) -> set[t.HLCommonHeader]:
-        """Return the set of command headers for all the matching commands."""
-        return {response.header for response in self.matching_commands}
+        object.__setattr__(
+            self,
+            "_matching_headers",
+            tuple(dict.fromkeys(response.header for response in commands)),
+        )
+
+    def matching_headers(self) -> tuple[t.HLCommonHeader, ...]:
+        """Return the unique headers of all the matching commands, in order."""
+        return self._matching_headers
 
     def resolve(self, response: t.CommandBase) -> bool:
         """Try to resolve listener.
@@ -433,11 +433,15 @@ class ControllerApplication(zigpy.application.ControllerApplication):
                 t_zboss.DatasetId.ZB_NVRAM_ADDR_MAP,
                 t_zboss.DSNwkAddrMap
             )
+        children = self.state.network_info.children
+        # Track known children in a set, the list lookup is linear
+        known_children = set(children)
         for rec in (map or []):
             if rec.nwk_addr == 0x0000:
                 continue
-            if rec.ieee_addr not in self.state.network_info.children:
-                self.state.network_info.children.append(rec.ieee_addr)
+            if rec.ieee_addr not in known_children:
+                known_children.add(rec.ieee_addr)
+                children.append(rec.ieee_addr)
             self.state.network_info.nwk_addresses[rec.ieee_addr] = rec.nwk_addr
 
         keys = await self._api.nvram.read(